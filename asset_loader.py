@@ -0,0 +1,79 @@
+"""Image loading shared by the games: lazy, pre-scaled and display-converted."""
+import pygame
+
+# (path, size) -> [surface, converted]
+_images = {}
+
+
+def load_image(path, size=None):
+    """Return the image at path, scaled to size, in the display's pixel format.
+
+    Images are loaded on first use and cached by (path, size), so every call
+    asking for the same asset shares one surface and scaling happens once.
+    Images with per-pixel alpha go through convert_alpha(), others through
+    convert(). Conversion needs a display mode; until one is set (e.g. in a
+    headless run) the unconverted image is returned and converted later.
+    """
+    key = (path, size)
+    entry = _images.get(key)
+    if entry is None:
+        if size is None:
+            image = pygame.image.load(path)
+        else:
+            image = pygame.transform.scale(load_image(path), size)
+        entry = _images[key] = [image, False]
+    if not entry[1] and pygame.display.get_surface() is not None:
+        image = entry[0]
+        entry[0] = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+        entry[1] = True
+    return entry[0]
+
+
+def paste(target, image, pos):
+    """Copy image into target at pos, per-pixel alpha included.
+
+    target must be an SRCALPHA surface that is still fully transparent
+    there, e.g. a new one. A plain blit would blend image's alpha into it;
+    MAX against the zeroed pixels copies pixels and alpha unchanged.
+    """
+    return target.blit(image, pos, special_flags=pygame.BLEND_RGBA_MAX)
+
+
+class SpriteAtlas:
+    """Several pre-scaled images packed side by side into one surface.
+
+    frames maps a frame name to (path, size). Every frame is scaled once
+    while the atlas is built and drawn as a sub-rect of the shared surface,
+    so drawing never scales or allocates.
+    """
+    def __init__(self, frames):
+        images = {name: load_image(path, size) for name, (path, size) in frames.items()}
+        width = sum(image.get_width() for image in images.values())
+        height = max(image.get_height() for image in images.values())
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.rects = {}
+        x = 0
+        for name, image in images.items():
+            paste(self.surface, image, (x, 0))
+            self.rects[name] = pygame.Rect(x, 0, image.get_width(), image.get_height())
+            x += image.get_width()
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+    def draw(self, target, name, pos):
+        """Blit frame name at pos onto target (a Surface or DirtyRenderer)."""
+        return target.blit(self.surface, pos, self.rects[name])
+
+
+class Animation:
+    """Cycles through atlas frame names, switching every ticks_per_frame draws."""
+    def __init__(self, names, ticks_per_frame):
+        self.names = tuple(names)
+        self.ticks_per_frame = ticks_per_frame
+        self.ticks = 0
+
+    def frame(self):
+        return self.names[self.ticks // self.ticks_per_frame % len(self.names)]
+
+    def advance(self):
+        self.ticks += 1
@@ -0,0 +1,91 @@
+"""Struct-of-arrays bullet storage for the jetfighter games."""
+import numpy as np
+import pygame
+
+
+class BulletSystem:
+    """Every live bullet of one kind, kept in parallel NumPy arrays.
+
+    Positions and velocities are rows of two float arrays with the live
+    bullets packed at the front, so moving all bullets is one vectorized add
+    and culling is one boolean mask that compacts the arrays. A bullet is
+    culled once it has crossed a screen edge while moving away from it.
+    Bullets are drawn with a single Surface.blits call; bullets without an
+    image are drawn as a solid rectangle of color.
+
+    The arrays are allocated once at capacity and the free slots are simply
+    the rows past the live ones; a bullet spawned while every slot is live
+    is dropped. count and high_water (the most bullets ever live at once)
+    are kept for monitoring.
+    """
+    def __init__(self, size, image=None, color=(255, 0, 0), bounds=(800, 600), capacity=256):
+        self.width, self.height = size
+        if image is None:
+            image = pygame.Surface(size)
+            image.fill(color)
+        self.image = image
+        self.bounds = bounds
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.count = 0
+        self.high_water = 0
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, vx, vy):
+        """Add a bullet, returning False if it was dropped for lack of room."""
+        if self.count == len(self.pos):
+            return False
+        self.pos[self.count] = x, y
+        self.vel[self.count] = vx, vy
+        self.count += 1
+        self.high_water = max(self.high_water, self.count)
+        return True
+
+    def clear(self):
+        self.count = 0
+
+    def stats(self):
+        return {"active": self.count, "high_water": self.high_water, "capacity": len(self.pos)}
+
+    def positions(self):
+        """View of the live bullets' (x, y) rows, oldest first."""
+        return self.pos[:self.count]
+
+    def step(self):
+        """Move every bullet by its velocity and drop the ones that left the screen."""
+        n = self.count
+        pos, vel = self.pos[:n], self.vel[:n]
+        pos += vel
+        gone = ((pos[:, 0] < 0) & (vel[:, 0] < 0)) | ((pos[:, 0] > self.bounds[0]) & (vel[:, 0] > 0))
+        gone |= ((pos[:, 1] < 0) & (vel[:, 1] < 0)) | ((pos[:, 1] > self.bounds[1]) & (vel[:, 1] > 0))
+        if gone.any():
+            self.keep(~gone)
+
+    def keep(self, mask):
+        """Keep only the bullets where mask (one bool per live bullet) is set."""
+        kept = np.count_nonzero(mask)
+        self.pos[:kept] = self.pos[:self.count][mask]
+        self.vel[:kept] = self.vel[:self.count][mask]
+        self.count = kept
+
+    def remove(self, indices):
+        mask = np.ones(self.count, dtype=bool)
+        mask[indices] = False
+        self.keep(mask)
+
+    def inside(self, x, y, width, height):
+        """Indices of bullets whose position lies strictly inside the rectangle."""
+        bx, by = self.positions().T
+        return np.flatnonzero((x < bx) & (bx < x + width) & (y < by) & (by < y + height))
+
+    def overlapping(self, x, y, width, height):
+        """Indices of bullets whose box overlaps the rectangle."""
+        bx, by = self.positions().T
+        return np.flatnonzero((bx < x + width) & (bx + self.width > x) &
+                              (by < y + height) & (by + self.height > y))
+
+    def draw(self, screen):
+        image = self.image
+        screen.blits([(image, pos) for pos in self.positions().astype(int).tolist()], doreturn=False)
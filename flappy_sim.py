@@ -0,0 +1,217 @@
+"""Population-wide Flappy Bird simulation for training flap controllers.
+
+Thousands of birds fly the same seeded course in one process, stepped
+together with NumPy. Physics and sizes match flappybird-game-gpt.py.
+Run it directly to fly a population of random linear controllers:
+
+    python flappy_sim.py --birds 2000 --seed 1 --render
+
+--render opens a window showing the course and the best bird still flying;
+without it the run is headless and uncapped, and the bird-frames/sec rate
+is printed at the end.
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+WIDTH, HEIGHT = 400, 600
+BIRD_X, BIRD_Y = 50, HEIGHT // 2
+BIRD_SIZE = 30
+GRAVITY = 0.5
+FLAP_STRENGTH = -10
+PIPE_WIDTH = 70
+PIPE_GAP = 200
+PIPE_VELOCITY = 3
+PIPE_SPACING = 200  # Distance from one pipe to the next
+PIPE_HEIGHTS = (100, 400)  # Range of the top pipe's height
+BLUE = (0, 0, 255)
+
+
+class PipeStream:
+    """Endless seeded sequence of top-pipe heights."""
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def next(self):
+        return self.rng.randint(*PIPE_HEIGHTS)
+
+
+class PipeRing:
+    """The pipes in play, kept as a fixed-size ring of top-pipe heights.
+
+    Pipes are spacing apart, so only the oldest pipe's x is stored. When
+    that pipe scrolls off the left edge, its slot is refilled in place with
+    the next height from the stream. The pipe at a given x-range is found
+    arithmetically instead of by scanning.
+    """
+    def __init__(self, stream, count, first_x, spacing=PIPE_SPACING, width=PIPE_WIDTH):
+        self.stream = stream
+        self.spacing = spacing
+        self.width = width
+        self.heights = [stream.next() for _ in range(count)]
+        self.first = 0  # Slot of the oldest pipe
+        self.x = first_x  # x of the oldest pipe
+        self.passed = 0  # Pipes that have scrolled off screen
+
+    def __iter__(self):
+        """Yield (x, height) for every pipe, oldest first."""
+        count = len(self.heights)
+        for k in range(count):
+            yield self.x + k * self.spacing, self.heights[(self.first + k) % count]
+
+    def scroll(self, dx):
+        """Move the pipes left by dx; return how many left the screen."""
+        self.x -= dx
+        passed = 0
+        while self.x + self.width < 0:
+            self.heights[self.first] = self.stream.next()
+            self.first = (self.first + 1) % len(self.heights)
+            self.x += self.spacing
+            passed += 1
+        self.passed += passed
+        return passed
+
+    def ahead(self, left):
+        """Return (x, height) of the first pipe whose right edge is past left."""
+        k = max(0, int((left - self.width - self.x) // self.spacing) + 1)
+        return self.x + k * self.spacing, self.heights[(self.first + k) % len(self.heights)]
+
+    def at(self, left, right):
+        """Return (x, height) of the pipe overlapping [left, right), or None."""
+        x, height = self.ahead(left)
+        return (x, height) if x < right else None
+
+
+class Population:
+    """n birds flying one shared course, one row per bird in NumPy arrays.
+
+    Every bird sits at BIRD_X, so only the one pipe overlapping that column
+    can hit anybody, and a frame's collisions are a few vectorized
+    comparisons against it. Dead birds stay where they fell. frames and
+    score (pipes passed) are each bird's fitness.
+    """
+    def __init__(self, n, seed=None):
+        self.pipes = PipeRing(PipeStream(seed), WIDTH // PIPE_SPACING + 2, WIDTH)
+        self.y = np.full(n, float(BIRD_Y))
+        self.velocity = np.zeros(n)
+        self.alive = np.ones(n, dtype=bool)
+        self.frames = np.zeros(n, dtype=int)
+        self.score = np.zeros(n, dtype=int)
+
+    def observe(self):
+        """Controller inputs, one row per bird: y, velocity, distance to the
+        next pipe and the height of its top pipe."""
+        x, height = self.pipes.ahead(BIRD_X)
+        return np.column_stack((self.y, self.velocity,
+                                np.full(len(self.y), float(x - BIRD_X)), np.full(len(self.y), float(height))))
+
+    def step(self, flap):
+        """Advance one frame; flap is a bool (or array of bools, one per
+        bird) saying who flaps. Returns whether any bird is still flying."""
+        alive = self.alive.copy()
+        self.velocity[alive & np.asarray(flap, dtype=bool)] = FLAP_STRENGTH
+        self.velocity[alive] += GRAVITY
+        # Positions are whole pixels, rounded like a pygame Rect
+        self.y[alive] = np.floor(self.y[alive] + self.velocity[alive] + 0.5)
+
+        self.score[alive] += self.pipes.scroll(PIPE_VELOCITY)
+        y = self.y
+        dead = (y >= HEIGHT) | (y <= 0)
+        pipe = self.pipes.at(BIRD_X, BIRD_X + BIRD_SIZE)
+        if pipe is not None:
+            height = pipe[1]
+            dead |= (y < height) | (y + BIRD_SIZE > height + PIPE_GAP)
+        self.alive &= ~dead
+        self.frames[self.alive] += 1
+        return self.alive.any()
+
+    def best(self):
+        """Index of the bird that has survived longest (a live one if any)."""
+        return int(np.argmax(self.frames + self.alive))
+
+    def draw(self, screen, bird_images, block_image):
+        """Draw the course and the best bird with the game's images."""
+        screen.fill(BLUE)
+        draw_pipes(screen, self.pipes, block_image)
+        i = self.best()
+        screen.blit(bird_images[0 if self.velocity[i] > 0 else 1], (BIRD_X, self.y[i]))
+
+
+def draw_pipes(screen, pipes, block_image, gap=PIPE_GAP):
+    """Draw every pipe in pipes as a top and a bottom block.
+
+    The top pipe is the lower end of the block and the bottom pipe its upper
+    end, so each is one whole-surface blit shifted past the screen edge,
+    which does the cropping. No crop rects are worked out per pipe; the
+    block just has to be at least as tall as the tallest pipe.
+    """
+    block_height = block_image.get_height()
+    for x, height in pipes:
+        screen.blit(block_image, (x, height - block_height))
+        screen.blit(block_image, (x, height + gap))
+
+
+def run(controller, n, seed=None, max_frames=10000, render=None):
+    """Fly n birds until all are dead or max_frames pass.
+
+    controller maps the (n, 4) observe() array to n flap decisions. render,
+    if given, is called with the population after every frame. Returns the
+    finished Population.
+    """
+    population = Population(n, seed)
+    for _ in range(max_frames):
+        if not population.step(controller(population.observe())):
+            break
+        if render is not None:
+            render(population)
+    return population
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fly a population of random flap controllers.")
+    parser.add_argument("--birds", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--frames", type=int, default=10000)
+    parser.add_argument("--render", action="store_true", help="show the best bird")
+    args = parser.parse_args()
+
+    # Random linear policies over normalized observations
+    rng = np.random.default_rng(args.seed)
+    weights = rng.normal(size=(args.birds, 4))
+    bias = rng.normal(size=args.birds)
+    scale = np.array([HEIGHT, 10.0, WIDTH, HEIGHT])
+
+    def controller(obs):
+        return np.einsum("ij,ij->i", obs / scale, weights) + bias > 0
+
+    render = None
+    if args.render:
+        import pygame
+        from asset_loader import load_image
+
+        pygame.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("Flappy Bird population")
+        bird_images = [load_image("assets/bird1.png", (BIRD_SIZE, BIRD_SIZE)),
+                       load_image("assets/bird2.png", (BIRD_SIZE, BIRD_SIZE))]
+        block_image = load_image("assets/block.png", (PIPE_WIDTH, 400))
+        clock = pygame.time.Clock()
+
+        def render(population):
+            pygame.event.pump()
+            population.draw(screen, bird_images, block_image)
+            pygame.display.update()
+            clock.tick(30)
+
+    started = time.perf_counter()
+    population = run(controller, args.birds, args.seed, args.frames, render)
+    elapsed = time.perf_counter() - started
+    best = population.best()
+    print(f"best bird {best}: {population.frames[best]} frames, {population.score[best]} pipes")
+    print(f"{population.frames.sum() / elapsed:.0f} bird-frames/sec")
+
+
+if __name__ == "__main__":
+    main()
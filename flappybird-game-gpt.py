@@ -1,5 +1,7 @@
 import pygame
-import random
+from asset_loader import load_image
+from flappy_sim import PipeRing, PipeStream, draw_pipes
+from text_cache import get_font, render_text
 
 # Initialize pygame
 pygame.init()
@@ -12,6 +14,8 @@ FLAP_STRENGTH = -10
 PIPE_WIDTH = 70
 PIPE_GAP = 200
 PIPE_VELOCITY = 3
+PIPE_SPACING = 200  # Distance from one pipe to the next
+PIPE_SEED = None  # Set to an int to fly the same course every game
 
 # Colors
 WHITE = (255, 255, 255)
@@ -23,34 +27,17 @@ pygame.display.set_caption("Flappy Bird")
 
 # Load assets
 bird_images = [
-    pygame.transform.scale(pygame.image.load("assets/bird1.png"), (30, 30)),  # Flap up image
-    pygame.transform.scale(pygame.image.load("assets/bird2.png"), (30, 30))   # Flap down image
+    load_image("assets/bird1.png", (30, 30)),  # Flap up image
+    load_image("assets/bird2.png", (30, 30))   # Flap down image
 ]
-block_image = pygame.image.load("assets/block.png")  # Load block image for pipes
-block_image = pygame.transform.scale(block_image, (PIPE_WIDTH, 400))  # Resize image for pipes
+block_image = load_image("assets/block.png", (PIPE_WIDTH, 400))  # Block image for pipes
 bird = pygame.Rect(BIRD_X, BIRD_Y, 30, 30)
 
-# Pipe class
-class Pipe:
-    def __init__(self, x):
-        self.x = x
-        self.height = random.randint(100, 400)
-        self.top_rect = pygame.Rect(self.x, 0, PIPE_WIDTH, self.height)
-        self.bottom_rect = pygame.Rect(self.x, self.height + PIPE_GAP, PIPE_WIDTH, HEIGHT - self.height - PIPE_GAP)
-    
-    def move(self):
-        self.x -= PIPE_VELOCITY
-        self.top_rect.x = self.x
-        self.bottom_rect.x = self.x
-    
-    def draw(self):
-        screen.blit(block_image, (self.x, 0), (0, 400 - self.height, PIPE_WIDTH, self.height))  # Draw top pipe
-        screen.blit(block_image, (self.x, self.height + PIPE_GAP), (0, 0, PIPE_WIDTH, HEIGHT - self.height - PIPE_GAP))  # Draw bottom pipe
-
 # Game variables
 def game_loop():
     velocity = 0
-    pipes = [Pipe(WIDTH + i * 200) for i in range(3)]
+    # Enough pipe slots to cover the screen; each is refilled as it scrolls off
+    pipes = PipeRing(PipeStream(PIPE_SEED), WIDTH // PIPE_SPACING + 2, WIDTH, PIPE_SPACING, PIPE_WIDTH)
     score = 0
     running = True
     clock = pygame.time.Clock()
@@ -83,22 +70,19 @@ def game_loop():
         screen.blit(bird_images[bird_frame], (bird.x, bird.y))  # Draw bird image with animation
         
         # Pipe mechanics
-        for pipe in pipes:
-            pipe.move()
-            pipe.draw()
-            
-            if pipe.x + PIPE_WIDTH < 0:
-                pipes.remove(pipe)
-                pipes.append(Pipe(WIDTH))
-                score += 1  # Increase score when a pipe is passed
-            
-            # Collision detection
-            if bird.colliderect(pipe.top_rect) or bird.colliderect(pipe.bottom_rect):
+        score += pipes.scroll(PIPE_VELOCITY)  # Increase score when a pipe is passed
+        draw_pipes(screen, pipes, block_image, PIPE_GAP)
+        
+        # Collision detection: only the pipe overlapping the bird's column can hit it
+        pipe = pipes.at(bird.left, bird.right)
+        if pipe is not None:
+            height = pipe[1]
+            if bird.top < height or bird.bottom > height + PIPE_GAP:
                 running = False  # Game over
         
         # Display score
-        font = pygame.font.Font(None, 36)
-        text = font.render(f"Score: {score}", True, WHITE)
+        font = get_font(None, 36)
+        text = render_text(font, f"Score: {score}", WHITE)
         screen.blit(text, (10, 10))
         
         pygame.display.update()
@@ -108,12 +92,12 @@ def game_loop():
 
 def end_game(score):
     screen.fill((0, 0, 0))  # Black background
-    font = pygame.font.Font(None, 50)
-    text = font.render(f"Game Over! Score: {score}", True, WHITE)
+    font = get_font(None, 50)
+    text = render_text(font, f"Game Over! Score: {score}", WHITE)
     screen.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 3))
     
-    font = pygame.font.Font(None, 36)
-    retry_text = font.render("Press R to Restart or Q to Quit", True, WHITE)
+    font = get_font(None, 36)
+    retry_text = render_text(font, "Press R to Restart or Q to Quit", WHITE)
     screen.blit(retry_text, (WIDTH // 2 - retry_text.get_width() // 2, HEIGHT // 2))
     
     pygame.display.update()
@@ -0,0 +1,60 @@
+"""Headless, uncapped runs of the maze games for batch AI evaluation.
+
+Run a game with --headless to skip the window, drawing and frame limiting:
+
+    python pacman-game-llama3.3.py --headless --ticks 5000 --moves RRDDL. --seed 1
+
+--moves is a Pac-Man input script, one letter per tick (U, D, L, R, or "."
+to keep going), repeated until the run ends. Without it Pac-Man turns at
+random every few ticks. The ticks/sec rate is printed when the run ends.
+"""
+import argparse
+import random
+import time
+
+MOVES = {"U": (0, -1), "D": (0, 1), "L": (-1, 0), "R": (1, 0)}
+
+
+class Session:
+    """Scripted input, tick budget and timing for one headless run."""
+    def __init__(self, ticks, moves="", seed=None, turn_every=5):
+        self.max_ticks = ticks
+        self.moves = moves.upper()
+        self.rng = random.Random(seed)
+        self.turn_every = turn_every
+        self.ticks = 0
+        self.started = None  # Set on the first tick so loading isn't timed
+
+    def next_direction(self, direction):
+        """Return Pac-Man's direction for the current tick."""
+        if self.started is None:
+            self.started = time.perf_counter()
+        if self.moves:
+            return MOVES.get(self.moves[self.ticks % len(self.moves)], direction)
+        if self.ticks % self.turn_every == 0:
+            return self.rng.choice(list(MOVES.values()))
+        return direction
+
+    def tick(self):
+        """Count a finished tick; return False once the budget is used up."""
+        self.ticks += 1
+        return self.ticks < self.max_ticks
+
+    def report(self):
+        elapsed = max(time.perf_counter() - (self.started or time.perf_counter()), 1e-9)
+        print(f"{self.ticks} ticks in {elapsed:.2f}s ({self.ticks / elapsed:.0f} ticks/sec)")
+
+
+def start_session(argv=None):
+    """Return a Session if the game was started with --headless, else None."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--moves", default="")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_known_args(argv)[0]
+    if not args.headless:
+        return None
+    if args.seed is not None:
+        random.seed(args.seed)  # Games place answers and pellets with the global RNG
+    return Session(args.ticks, args.moves, args.seed)
@@ -1,5 +1,9 @@
 import pygame
 import random
+from asset_loader import load_image
+from bullet_system import BulletSystem
+from scrolling_background import ScrollingBackground
+from text_cache import get_font, render_text
 
 # Initialize pygame
 pygame.init()
@@ -21,14 +25,16 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Jet Fighter")
 
 # Load assets
-player_img = pygame.image.load("assets/fighter.png")
-enemy_img = pygame.image.load("assets/fighter2.png")
-background_img = pygame.image.load("assets/background_large.jpg")
-bullet_img = pygame.image.load("assets/bullet.png")  # Load player bullet image
-bullet_img = pygame.transform.scale(bullet_img, (15, 15))  # Resize bullet image
+player_img = load_image("assets/fighter.png", (50, 50))
+enemy_img = load_image("assets/fighter2.png", (50, 50))
+background_img = load_image("assets/background_large.jpg")
+bullet_img = load_image("assets/bullet.png", (15, 15))  # Load player bullet image
 
-player_img = pygame.transform.scale(player_img, (50, 50))
-enemy_img = pygame.transform.scale(enemy_img, (50, 50))
+# Backdrop scrolling down one pixel per frame
+BACKGROUND = ScrollingBackground(background_img, (WIDTH, HEIGHT), speed=1)
+
+# Bullets fired by every enemy, moved and drawn together
+ENEMY_BULLETS = BulletSystem((5, 10), color=BLUE, bounds=(WIDTH, HEIGHT))
 
 # Game classes
 class Player:
@@ -37,7 +43,7 @@ class Player:
         self.x = WIDTH // 2
         self.y = HEIGHT - 70
         self.speed = PLAYER_SPEED
-        self.bullets = []
+        self.bullets = BulletSystem((15, 15), image=bullet_img, bounds=(WIDTH, HEIGHT))
 
     def move(self, direction):
         if direction == "left" and self.x > 0:
@@ -50,39 +56,11 @@ class Player:
             self.y += self.speed
 
     def shoot(self):
-        self.bullets.append(Bullet(self.x + 20, self.y))
-
-    def draw(self, screen):
-        screen.blit(self.image, (self.x, self.y))
-        for bullet in self.bullets:
-            bullet.draw(screen)
-
-class Bullet:
-    def __init__(self, x, y):
-        self.image = bullet_img  # Use the loaded bullet image
-        self.x = x
-        self.y = y
-        self.speed = BULLET_SPEED
-
-    def move(self):
-        self.y -= self.speed
+        self.bullets.spawn(self.x + 20, self.y, 0, -BULLET_SPEED)
 
     def draw(self, screen):
         screen.blit(self.image, (self.x, self.y))
-
-class EnemyBullet:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.speed = ENEMY_BULLET_SPEED
-        self.width = 5
-        self.height = 10
-
-    def move(self):
-        self.y += self.speed
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, BLUE, (self.x, self.y, self.width, self.height))
+        self.bullets.draw(screen)
 
 class Enemy:
     def __init__(self):
@@ -90,23 +68,20 @@ class Enemy:
         self.x = random.randint(0, WIDTH - 50)
         self.y = random.randint(-100, -40)
         self.speed = ENEMY_SPEED
-        self.enemy_bullets = []
 
     def move(self):
         self.y += self.speed
 
     def shoot(self):
-        self.enemy_bullets.append(EnemyBullet(self.x + 20, self.y + 50))
+        ENEMY_BULLETS.spawn(self.x + 20, self.y + 50, 0, ENEMY_BULLET_SPEED)
 
     def draw(self, screen):
         screen.blit(self.image, (self.x, self.y))
-        for bullet in self.enemy_bullets:
-            bullet.draw(screen)
 
 # Display Game Over Message
 def show_message(message):
-    font = pygame.font.Font(None, 30)
-    text = font.render(message, True, RED)
+    font = get_font(None, 30)
+    text = render_text(font, message, RED)
     screen.fill(BLACK)
     screen.blit(text, (WIDTH // 8, HEIGHT // 2))
     pygame.display.flip()
@@ -130,12 +105,13 @@ def game_loop():
     running = True
     clock = pygame.time.Clock()
     player = Player()
+    ENEMY_BULLETS.clear()
     enemies = [Enemy() for _ in range(5)]
     score = 0
 
     while running:
-        screen.fill(WHITE)
-        screen.blit(background_img, (0, 0))
+        BACKGROUND.draw(screen)  # Covers the whole screen, no fill needed
+        BACKGROUND.scroll()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -153,11 +129,8 @@ def game_loop():
         if keys[pygame.K_SPACE]:
             player.shoot()
 
-        # Move and draw bullets
-        for bullet in player.bullets[:]:
-            bullet.move()
-            if bullet.y < 0:
-                player.bullets.remove(bullet)
+        # Move bullets and drop the ones past the top of the screen
+        player.bullets.step()
 
         # Move and draw enemies
         for enemy in enemies[:]:
@@ -170,39 +143,35 @@ def game_loop():
             if random.random() < 0.01:  # 1% chance each frame to shoot
                 enemy.shoot()
 
-            # Move enemy bullets
-            for enemy_bullet in enemy.enemy_bullets[:]:
-                enemy_bullet.move()
-                if enemy_bullet.y > HEIGHT:
-                    enemy.enemy_bullets.remove(enemy_bullet)
+        # Move enemy bullets
+        ENEMY_BULLETS.step()
 
         # Collision detection
         for enemy in enemies[:]:
-            for bullet in player.bullets[:]:
-                if enemy.x < bullet.x < enemy.x + 50 and enemy.y < bullet.y < enemy.y + 50:
-                    enemies.remove(enemy)
-                    player.bullets.remove(bullet)
-                    enemies.append(Enemy())
-                    score += 1
-                    if score >= WINNING_SCORE:
-                        running = False
-                        show_message("You Win! Press R to Restart or Q to Quit")
-                    break
+            hits = player.bullets.inside(enemy.x, enemy.y, 50, 50)
+            if len(hits):
+                enemies.remove(enemy)
+                player.bullets.remove(hits[0])
+                enemies.append(Enemy())
+                score += 1
+                if score >= WINNING_SCORE:
+                    running = False
+                    show_message("You Win! Press R to Restart or Q to Quit")
 
             # Check if enemy collides with player
             if enemy.x < player.x + 50 and enemy.x + 50 > player.x and enemy.y < player.y + 50 and enemy.y + 50 > player.y:
                 running = False  # End game if player is hit
                 show_message("Game Over! Press R to Restart or Q to Quit")
 
-            # Check if enemy bullets hit the player
-            for enemy_bullet in enemy.enemy_bullets[:]:
-                if enemy_bullet.x < player.x + 50 and enemy_bullet.x + 5 > player.x and enemy_bullet.y < player.y + 50 and enemy_bullet.y + 10 > player.y:
-                    running = False  # End game if player is hit
-                    show_message("Game Over! Press R to Restart or Q to Quit")
+        # Check if enemy bullets hit the player
+        if len(ENEMY_BULLETS.overlapping(player.x, player.y, 50, 50)):
+            running = False  # End game if player is hit
+            show_message("Game Over! Press R to Restart or Q to Quit")
 
         player.draw(screen)
         for enemy in enemies:
             enemy.draw(screen)
+        ENEMY_BULLETS.draw(screen)
 
         pygame.display.flip()
         clock.tick(30)
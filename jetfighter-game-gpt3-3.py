@@ -1,5 +1,11 @@
 import pygame
 import random
+from asset_loader import load_image
+from bullet_system import BulletSystem
+from object_pool import ObjectPool
+from scrolling_background import ScrollingBackground
+from spatial_hash import SpatialHash
+from text_cache import get_font, render_text
 
 # Initialize pygame
 pygame.init()
@@ -16,23 +22,30 @@ BULLET_SPEED = 7
 ENEMY_BULLET_SPEED = 5
 WINNING_SCORE = 10  # Number of enemies to destroy to win
 EXTRA_LIFE_SPAWN_RATE = 0.002  # Probability of spawning an extra life each frame
+ENEMY_COUNT = 5  # Enemies on screen at once
+COLLISION_CELL_SIZE = 64  # Grid cell size for bullet/enemy collision checks
+MAX_BULLETS = 256  # Player bullets alive at once; extra shots are dropped
+MAX_ENEMY_BULLETS = 1024
 
 # Create the screen
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Jet Fighter")
 
 # Load assets
-player_img = pygame.image.load("assets/fighter.png")
-enemy_img = pygame.image.load("assets/fighter2.png")
-background_img = pygame.image.load("assets/background_large.jpg")
-bullet_img = pygame.image.load("assets/bullet.png")  # Player bullet image
-extra_life_img = pygame.image.load("assets/life.png")  # Extra life image
-
-# Resize images
-player_img = pygame.transform.scale(player_img, (50, 50))
-enemy_img = pygame.transform.scale(enemy_img, (50, 50))
-bullet_img = pygame.transform.scale(bullet_img, (15, 30))  # Resize bullet
-extra_life_img = pygame.transform.scale(extra_life_img, (30, 30))  # Resize extra life
+player_img = load_image("assets/fighter.png", (50, 50))
+enemy_img = load_image("assets/fighter2.png", (50, 50))
+background_img = load_image("assets/background_large.jpg")
+bullet_img = load_image("assets/bullet.png", (15, 30))  # Player bullet image
+extra_life_img = load_image("assets/life.png", (30, 30))  # Extra life image
+
+# Backdrop scrolling down one pixel per frame
+BACKGROUND = ScrollingBackground(background_img, (WIDTH, HEIGHT), speed=1)
+
+# Bullets fired by every enemy, moved and drawn together
+ENEMY_BULLETS = BulletSystem((5, 10), color=BLUE, bounds=(WIDTH, HEIGHT), capacity=MAX_ENEMY_BULLETS)
+
+# Player bullets bucketed by grid cell, rebuilt every frame
+BULLET_GRID = SpatialHash(COLLISION_CELL_SIZE)
 
 # Game classes
 class Player:
@@ -41,7 +54,7 @@ class Player:
         self.x = WIDTH // 2
         self.y = HEIGHT - 70
         self.speed = PLAYER_SPEED
-        self.bullets = []
+        self.bullets = BulletSystem((15, 30), image=bullet_img, bounds=(WIDTH, HEIGHT), capacity=MAX_BULLETS)
         self.lives = 3  # Player starts with 3 lives
 
     def move(self, direction):
@@ -55,72 +68,58 @@ class Player:
             self.y += self.speed
 
     def shoot(self):
-        self.bullets.append(Bullet(self.x + 20, self.y))
-
-    def draw(self, screen):
-        screen.blit(self.image, (self.x, self.y))
-        for bullet in self.bullets:
-            bullet.draw(screen)
-
-class Bullet:
-    def __init__(self, x, y):
-        self.image = bullet_img
-        self.x = x
-        self.y = y
-        self.speed = BULLET_SPEED
-
-    def move(self):
-        self.y -= self.speed
+        self.bullets.spawn(self.x + 20, self.y, 0, -BULLET_SPEED)
 
     def draw(self, screen):
         screen.blit(self.image, (self.x, self.y))
-
-class EnemyBullet:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.speed = ENEMY_BULLET_SPEED
-        self.width = 5
-        self.height = 10
-
-    def move(self):
-        self.y += self.speed
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, BLUE, (self.x, self.y, self.width, self.height))
+        self.bullets.draw(screen)
 
 class Enemy:
     def __init__(self):
         self.image = enemy_img
+        self.x = self.y = 0
+        self.speed = ENEMY_SPEED
+
+    def reset(self):
+        # Respawn above the screen at a random column
         self.x = random.randint(0, WIDTH - 50)
         self.y = random.randint(-100, -40)
-        self.speed = ENEMY_SPEED
-        self.enemy_bullets = []
 
     def move(self):
         self.y += self.speed
 
     def shoot(self):
-        self.enemy_bullets.append(EnemyBullet(self.x + 20, self.y + 50))
+        ENEMY_BULLETS.spawn(self.x + 20, self.y + 50, 0, ENEMY_BULLET_SPEED)
 
     def draw(self, screen):
         screen.blit(self.image, (self.x, self.y))
-        for bullet in self.enemy_bullets:
-            bullet.draw(screen)
 
 class ExtraLife:
     def __init__(self):
         self.image = extra_life_img
+        self.x = self.y = 0
+
+    def reset(self):
         self.x = random.randint(0, WIDTH - 30)
         self.y = random.randint(0, HEIGHT - 30)
 
     def draw(self, screen):
         screen.blit(self.image, (self.x, self.y))
 
+# Preallocated entities, recycled instead of created on every spawn. The
+# spare enemy lets a replacement be taken before its predecessor is freed.
+ENEMY_POOL = ObjectPool(Enemy, ENEMY_COUNT + 1)
+EXTRA_LIFE_POOL = ObjectPool(ExtraLife, 1)
+
+def replace_enemy(enemies, enemy):
+    enemies.remove(enemy)
+    enemies.append(ENEMY_POOL.acquire())
+    ENEMY_POOL.release(enemy)
+
 # Display Game Over Message
 def show_message(message):
-    font = pygame.font.Font(None, 30)
-    text = font.render(message, True, RED)
+    font = get_font(None, 30)
+    text = render_text(font, message, RED)
     screen.fill(BLACK)
     screen.blit(text, (WIDTH // 8, HEIGHT // 2))
     pygame.display.flip()
@@ -144,13 +143,16 @@ def game_loop():
     running = True
     clock = pygame.time.Clock()
     player = Player()
-    enemies = [Enemy() for _ in range(5)]
+    ENEMY_BULLETS.clear()
+    ENEMY_POOL.clear()
+    EXTRA_LIFE_POOL.clear()
+    enemies = [ENEMY_POOL.acquire() for _ in range(ENEMY_COUNT)]
     extra_life = None  # Initially no extra life
     score = 0
 
     while running:
-        screen.fill(WHITE)
-        screen.blit(background_img, (0, 0))
+        BACKGROUND.draw(screen)  # Covers the whole screen, no fill needed
+        BACKGROUND.scroll()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -168,69 +170,77 @@ def game_loop():
         if keys[pygame.K_SPACE]:
             player.shoot()
 
-        # Move and draw bullets
-        for bullet in player.bullets[:]:
-            bullet.move()
-            if bullet.y < 0:
-                player.bullets.remove(bullet)
+        # Move bullets and drop the ones past the top of the screen
+        player.bullets.step()
 
         # Move and draw enemies
         for enemy in enemies[:]:
             enemy.move()
             if enemy.y > HEIGHT:
-                enemies.remove(enemy)
-                enemies.append(Enemy())
+                replace_enemy(enemies, enemy)
 
             # Enemy shooting logic
             if random.random() < 0.01:
                 enemy.shoot()
 
-            for enemy_bullet in enemy.enemy_bullets[:]:
-                enemy_bullet.move()
-                if enemy_bullet.y > HEIGHT:
-                    enemy.enemy_bullets.remove(enemy_bullet)
+        # Move enemy bullets
+        ENEMY_BULLETS.step()
 
         # Spawn extra life randomly
         if extra_life is None and random.random() < EXTRA_LIFE_SPAWN_RATE:
-            extra_life = ExtraLife()
+            extra_life = EXTRA_LIFE_POOL.acquire()
 
         # Check if player picks up extra life
         if extra_life:
             if player.x < extra_life.x + 30 and player.x + 50 > extra_life.x and player.y < extra_life.y + 30 and player.y + 50 > extra_life.y:
                 player.lives += 1
+                EXTRA_LIFE_POOL.release(extra_life)
                 extra_life = None  # Remove after pickup
 
-        # Collision detection
-        for enemy in enemies[:]:
-            for bullet in player.bullets[:]:
-                if enemy.x < bullet.x < enemy.x + 50 and enemy.y < bullet.y < enemy.y + 50:
-                    enemies.remove(enemy)
-                    player.bullets.remove(bullet)
-                    enemies.append(Enemy())
-                    score += 1
-                    if score >= WINNING_SCORE:
-                        running = False
-                        show_message("You Win! Press R to Restart or Q to Quit")
-                    break
-
-            for enemy_bullet in enemy.enemy_bullets[:]:
-                if enemy_bullet.x < player.x + 50 and enemy_bullet.x + 5 > player.x and enemy_bullet.y < player.y + 50 and enemy_bullet.y + 10 > player.y:
-                    player.lives -= 1
-                    enemy.enemy_bullets.remove(enemy_bullet)
-                    if player.lives <= 0:
-                        running = False
-                        show_message("Game Over! Press R to Restart or Q to Quit")
+        # Collision detection: each enemy is only tested against the bullets
+        # in the grid cells it covers
+        positions = player.bullets.positions()
+        BULLET_GRID.build(positions[:, 0], positions[:, 1])
+        hit_enemies, hit_bullets = BULLET_GRID.pairs([enemy.x for enemy in enemies],
+                                                     [enemy.y for enemy in enemies], 50, 50)
+        destroyed = []
+        spent = set()
+        for e, b in zip(hit_enemies.tolist(), hit_bullets.tolist()):
+            # An enemy is destroyed by its oldest bullet not already spent on another
+            if destroyed and destroyed[-1] is enemies[e] or b in spent:
+                continue
+            destroyed.append(enemies[e])
+            spent.add(b)
+        if spent:
+            player.bullets.remove(list(spent))
+
+        for enemy in destroyed:
+            replace_enemy(enemies, enemy)
+            score += 1
+            if score >= WINNING_SCORE:
+                running = False
+                show_message("You Win! Press R to Restart or Q to Quit")
+
+        # Every enemy bullet that hits the player costs a life
+        hits = ENEMY_BULLETS.overlapping(player.x, player.y, 50, 50)
+        if len(hits):
+            player.lives -= len(hits)
+            ENEMY_BULLETS.remove(hits)
+            if player.lives <= 0:
+                running = False
+                show_message("Game Over! Press R to Restart or Q to Quit")
 
         # Draw everything
         player.draw(screen)
         for enemy in enemies:
             enemy.draw(screen)
+        ENEMY_BULLETS.draw(screen)
         if extra_life:
             extra_life.draw(screen)
 
         # Display player lives
-        font = pygame.font.Font(None, 36)
-        lives_text = font.render(f"Lives: {player.lives}", True, RED)
+        font = get_font(None, 36)
+        lives_text = render_text(font, f"Lives: {player.lives}", RED)
         screen.blit(lives_text, (10, 10))
 
         pygame.display.flip()
@@ -1,5 +1,6 @@
 import pygame
 import sys
+from tilemap import Camera, ChunkStreamer, TileMap
 
 # Initialize Pygame
 pygame.init()
@@ -15,13 +16,14 @@ WHITE = (255, 255, 255)
 BLUE = (0, 0, 255)
 GREEN = (0, 255, 0)
 RED = (255, 0, 0)
+BROWN = (139, 69, 19)
 
 # Clock for controlling the frame rate
 clock = pygame.time.Clock()
 
 # Mario properties
 mario_x = 100
-mario_y = 400
+mario_y = 350  # Standing on the platform below
 mario_width = 50
 mario_height = 50
 mario_velocity_x = 0
@@ -29,25 +31,60 @@ mario_velocity_y = 0
 gravity = 1
 jump_strength = -15
 
-# Platform properties
-platforms = [
-    pygame.Rect(300, 500, 200, 20),
-    pygame.Rect(100, 400, 200, 20),
-    pygame.Rect(500, 300, 200, 20)
-]
-
-# Function to check for collisions
-def check_collision(rect, platforms):
-    for platform in platforms:
-        if rect.colliderect(platform):
-            return True
-    return False
+# Level: one character per 20x20 tile, '#' solid block, '=' one-way platform
+LEVEL_TEXT = """
+........................................
+........................................
+........................................
+........................................
+........................................
+........................................
+........................................
+........................................
+........................................
+........................................
+........................................
+........................................
+........................................
+........................................
+........................................
+.........................==========.....
+........................................
+........................................
+........................................
+........................................
+.....==========.........................
+........................................
+........................................
+........................................
+........................................
+...............==========...............
+........................................
+........................................
+........................................
+........................................
+"""
+TILE_COLORS = {"#": BROWN, "=": GREEN}
+
+# A level file can be given on the command line instead
+level = TileMap.load(sys.argv[1]) if len(sys.argv) > 1 else TileMap.parse(LEVEL_TEXT)
+
+# The view follows Mario; only the level chunks near it are kept rendered
+camera = Camera((SCREEN_WIDTH, SCREEN_HEIGHT), (level.width, level.height))
+chunks = ChunkStreamer(level, TILE_COLORS, SCREEN_WIDTH, background=WHITE)
+
+# Screen area past the level's right and bottom edges (only for levels smaller than the view)
+outside = [rect for rect in (pygame.Rect(level.width, 0, SCREEN_WIDTH, SCREEN_HEIGHT),
+                             pygame.Rect(0, level.height, SCREEN_WIDTH, SCREEN_HEIGHT))
+           if rect.colliderect(screen.get_rect())]
 
 # Main game loop
 running = True
 on_ground = False
 while running:
-    screen.fill(WHITE)
+    # The chunks cover the rest of the view, so only the area past the level is cleared
+    for rect in outside:
+        screen.fill(WHITE, rect)
 
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
@@ -70,33 +107,32 @@ while running:
     # Apply gravity
     mario_velocity_y += gravity
 
-    # Update Mario's position
-    mario_x += mario_velocity_x
-    mario_y += mario_velocity_y
+    # Update Mario's position one axis at a time, stopping at tiles
+    mario_x, _ = level.move_x(mario_x, mario_y, mario_width, mario_height, mario_velocity_x)
+    mario_y, hit = level.move_y(mario_x, mario_y, mario_width, mario_height, mario_velocity_y)
+    on_ground = hit and mario_velocity_y > 0
+    if hit:
+        mario_velocity_y = 0
 
-    # Create Mario's rectangle
-    mario_rect = pygame.Rect(mario_x, mario_y, mario_width, mario_height)
+    # Keep Mario inside the level horizontally
+    mario_x = min(max(mario_x, 0), level.width - mario_width)
 
-    # Check for collisions with platforms
-    on_ground = False
-    for platform in platforms:
-        if mario_rect.colliderect(platform) and mario_velocity_y > 0:
-            mario_y = platform.top - mario_height
-            mario_velocity_y = 0
-            on_ground = True
-
-    # Prevent Mario from falling through the bottom of the screen
-    if mario_y + mario_height > SCREEN_HEIGHT:
-        mario_y = SCREEN_HEIGHT - mario_height
+    # Prevent Mario from falling through the bottom of the level
+    if mario_y + mario_height > level.height:
+        mario_y = level.height - mario_height
         mario_velocity_y = 0
         on_ground = True
 
-    # Draw platforms
-    for platform in platforms:
-        pygame.draw.rect(screen, GREEN, platform)
+    # Create Mario's rectangle
+    mario_rect = pygame.Rect(mario_x, mario_y, mario_width, mario_height)
+
+    # Scroll to Mario and draw the level chunks in view
+    camera.follow(mario_x, mario_y, mario_width, mario_height)
+    chunks.update(camera.x)
+    chunks.draw(screen, camera)
 
     # Draw Mario
-    pygame.draw.rect(screen, RED, mario_rect)
+    pygame.draw.rect(screen, RED, camera.apply(mario_rect))
 
     # Update the display
     pygame.display.flip()
@@ -1,7 +1,11 @@
 import pygame
 import sys
 import random
-from collections import deque
+import headless
+from maze_render import MazeLayer, DirtyRenderer
+from asset_loader import load_image, SpriteAtlas, Animation
+from maze_nav import MazeGrid, compile_maze
+from text_cache import render_text
 
 # Initialize Pygame
 pygame.init()
@@ -16,9 +20,11 @@ BLACK = (0, 0, 0)
 RED = (255, 50, 50)
 GREEN = (50, 255, 50)
 
-# Initialize screen
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Math Learning Game")
+# Initialize screen (no window when running headless)
+SESSION = headless.start_session()
+if SESSION is None:
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Math Learning Game")
 clock = pygame.time.Clock()
 FPS = 10
 
@@ -43,8 +49,12 @@ LEVEL = [
     "11110000000000002111",
     "11111111111111111111"
 ]
-ROWS, COLS = len(LEVEL), len(LEVEL[0])
-grid = [[int(cell) for cell in row] for row in LEVEL]
+MAZE = MazeGrid(LEVEL)  # Flat walkability mask and neighbor index
+ROWS, COLS = MAZE.rows, MAZE.cols
+grid = MAZE.grid
+
+# Precompute ghost navigation for the level
+NAV_TABLE = compile_maze(MAZE)
 
 def get_valid_positions():
     """Pre-compute and return all valid positions where Pac-Man can move."""
@@ -58,16 +68,22 @@ def get_valid_positions():
 valid_positions = get_valid_positions()
 
 # Load game assets
-PACMAN_FRAMES = [
-    pygame.image.load("assets/man1.png"),
-    pygame.image.load("assets/man2.png"),
-]
-GHOST_SPRITES = {
-    "red": pygame.image.load("assets/police1.png"),
-    "blue": pygame.image.load("assets/police3.png"),
-}
-WALL_TILE = pygame.image.load("assets/fence.png")
-BACKGROUND_IMAGE = pygame.image.load("assets/background.png")
+# Character and icon frames, pre-scaled to the tile size and packed into one surface
+TILE = (TILE_SIZE, TILE_SIZE)
+SPRITES = SpriteAtlas({
+    "man1": ("assets/man1.png", TILE),  # Mouth open
+    "man2": ("assets/man2.png", TILE),  # Mouth closed
+    "red": ("assets/police1.png", TILE),
+    "blue": ("assets/police3.png", TILE),
+})
+WALL_TILE = load_image("assets/fence.png")
+BACKGROUND_IMAGE = load_image("assets/background.png")
+
+# Background and walls, rendered once and reused every frame
+MAZE_LAYER = MazeLayer((WIDTH, HEIGHT), BACKGROUND_IMAGE, {1: WALL_TILE})
+
+# Redraws only the tiles and UI regions that change between frames
+RENDERER = DirtyRenderer(MAZE_LAYER)
 
 # UI font
 FONT = pygame.font.Font(None, 36)
@@ -78,12 +94,12 @@ def draw_answers(answers):
     """Draw the answer circles with numbers inside."""
     for answer, ax, ay in answers:
         # Draw a green circle for the answer
-        pygame.draw.circle(
+        RENDERER.mark(pygame.draw.circle(
             screen, GREEN, (ax * TILE_SIZE + TILE_SIZE // 2, ay * TILE_SIZE + TILE_SIZE // 2), TILE_SIZE // 2
-        )
+        ))
         # Draw the associated number on the circle
-        answer_text = FONT.render(str(answer), True, BLACK)  # Number text in black
-        screen.blit(
+        answer_text = render_text(FONT, str(answer), BLACK)  # Number text in black
+        RENDERER.blit(
             answer_text,
             (
                 ax * TILE_SIZE + TILE_SIZE // 2 - answer_text.get_width() // 2,
@@ -98,19 +114,18 @@ class PacMan:
         self.x = x
         self.y = y
         self.direction = (0, 0)
-        self.frame = 0
+        self.animation = Animation(("man1", "man2"), 10)
 
     def move(self):
         new_x = self.x + self.direction[0]
         new_y = self.y + self.direction[1]
-        if 0 <= new_x < COLS and 0 <= new_y < ROWS and grid[new_y][new_x] != 1:
+        if MAZE.is_walkable(new_x, new_y):
             self.x = new_x
             self.y = new_y
 
     def draw(self):
-        sprite = PACMAN_FRAMES[self.frame // 10 % len(PACMAN_FRAMES)]
-        screen.blit(pygame.transform.scale(sprite, (TILE_SIZE, TILE_SIZE)), (self.x * TILE_SIZE, self.y * TILE_SIZE))
-        self.frame += 1
+        SPRITES.draw(RENDERER, self.animation.frame(), (self.x * TILE_SIZE, self.y * TILE_SIZE))
+        self.animation.advance()
 
 
 class Ghost:
@@ -119,78 +134,37 @@ class Ghost:
         self.x = x
         self.y = y
         self.color = color
-        self.sprite = pygame.transform.scale(GHOST_SPRITES[color], (TILE_SIZE, TILE_SIZE))
-        self.path = []
         self.counter = 0
 
     def move(self, target):
-        if self.counter < 3:  # Move every 3 frames
+        if self.counter < 1:  # Move every 2 frames (called once per frame)
             self.counter += 1
             return
         self.counter = 0
-        if not self.path or (self.x, self.y) == self.path[0]:
-            self.path = self.bfs((self.x, self.y), target)
-        if self.path:
-            next_step = self.path.pop(0)
+        next_step = NAV_TABLE.next_step((self.x, self.y), target)
+        if next_step:
             self.x, self.y = next_step
 
-    def bfs(self, start, target):
-        """Breadth-First Search to find shortest path."""
-        queue = deque([start])
-        came_from = {start: None}
-        while queue:
-            current = queue.popleft()
-            if current == target:
-                break
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in came_from:
-                    queue.append(neighbor)
-                    came_from[neighbor] = current
-        path = []
-        current = target
-        while current is not None:
-            path.append(current)
-            current = came_from.get(current)
-        return path[::-1]
-
-    def get_neighbors(self, pos):
-        x, y = pos
-        neighbors = []
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < COLS and 0 <= ny < ROWS and grid[ny][nx] in (0, 2):
-                neighbors.append((nx, ny))
-        return neighbors
-
     def draw(self):
-        screen.blit(self.sprite, (self.x * TILE_SIZE, self.y * TILE_SIZE))
-
+        SPRITES.draw(RENDERER, self.color, (self.x * TILE_SIZE, self.y * TILE_SIZE))
 
-def draw_background():
-    """Draw the background image."""
-    screen.blit(pygame.transform.scale(BACKGROUND_IMAGE, (WIDTH, HEIGHT)), (0, 0))
 
-
-def draw_grid():
-    """Render the level layout with wall and exit tiles."""
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell == 1:  # Wall
-                screen.blit(pygame.transform.scale(WALL_TILE, (TILE_SIZE, TILE_SIZE)), (x * TILE_SIZE, y * TILE_SIZE))
+def draw_maze():
+    """Restore the cached background and level layout under last frame's sprites."""
+    RENDERER.begin(MAZE, TILE_SIZE)
 
 
 def draw_math_question(question):
     """Display the current math question on the screen."""
-    text = BIG_FONT.render(question, True, WHITE)
-    screen.blit(text, (WIDTH // 2 - text.get_width() // 2, 10))
+    text = render_text(BIG_FONT, question, WHITE)
+    RENDERER.blit(text, (WIDTH // 2 - text.get_width() // 2, 10))
 
 def draw_scorelives(score, lives):
     """Render UI showing score and lives."""
-    score_text = FONT.render(f"Score: {score}", True, WHITE)
-    screen.blit(score_text, (10, HEIGHT - 40))
+    score_text = render_text(FONT, f"Score: {score}", WHITE)
+    RENDERER.blit(score_text, (10, HEIGHT - 40))
     for i in range(lives):
-        screen.blit(pygame.transform.scale(PACMAN_FRAMES[0], (TILE_SIZE, TILE_SIZE)),
-                    (WIDTH - (i + 1) * TILE_SIZE - 10, HEIGHT - 40))
+        SPRITES.draw(RENDERER, "man1", (WIDTH - (i + 1) * TILE_SIZE - 10, HEIGHT - 40))
         
 def main():
     pacman = PacMan(1, 1)
@@ -227,18 +201,22 @@ def main():
     running = True
 
     while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    pacman.direction = (0, -1)
-                elif event.key == pygame.K_DOWN:
-                    pacman.direction = (0, 1)
-                elif event.key == pygame.K_LEFT:
-                    pacman.direction = (-1, 0)
-                elif event.key == pygame.K_RIGHT:
-                    pacman.direction = (1, 0)
+        if SESSION:
+            # Scripted input instead of keyboard events
+            pacman.direction = SESSION.next_direction(pacman.direction)
+        else:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_UP:
+                        pacman.direction = (0, -1)
+                    elif event.key == pygame.K_DOWN:
+                        pacman.direction = (0, 1)
+                    elif event.key == pygame.K_LEFT:
+                        pacman.direction = (-1, 0)
+                    elif event.key == pygame.K_RIGHT:
+                        pacman.direction = (1, 0)
 
         pacman.move()
 
@@ -271,11 +249,14 @@ def main():
         #     print("You Win!")
         #     running = False
 
-        draw_background()
-        draw_grid()
+        if SESSION:
+            # Headless runs skip drawing and frame limiting
+            running = SESSION.tick() and running
+            continue
+
+        draw_maze()  # Background and level layout
         pacman.draw()
         for ghost in ghosts:
-            ghost.move((pacman.x, pacman.y))
             ghost.draw()
         draw_math_question(f"{current_question} = ?")
         #for answer, ax, ay in answers:
@@ -284,9 +265,11 @@ def main():
 
         draw_scorelives(score, lives)
 
-        pygame.display.flip()
+        RENDERER.present()  # Push only the changed regions
         clock.tick(FPS)
 
+    if SESSION:
+        SESSION.report()
     pygame.quit()
     sys.exit()
 
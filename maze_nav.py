@@ -0,0 +1,933 @@
+"""Maze navigation shared by the tile-based Pac-Man games."""
+import heapq
+from array import array
+from collections import OrderedDict, deque
+
+# Tile values the characters can stand on (0 = path, 2 = exit)
+WALKABLE = (0, 2)
+
+# Neighbor offsets, indexed by direction number
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+NO_DIRECTION = 255
+INF = float("inf")
+
+
+def load_level(path):
+    """Read a level file: one row of tile digits per line (0 = path, 1 = wall, 2 = exit)."""
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+class MazeGrid:
+    """Compact maze representation built once when the level is parsed.
+
+    Tiles are numbered row-major (index = y * cols + x). Tile values live in
+    a flat bytearray, walkability in a 0/1 bytearray mask, and the in-bounds
+    neighbors of every tile in a CSR index: the neighbors of tile i are
+    neighbors[offsets[i]:offsets[i + 1]]. Searches walk these arrays instead
+    of building neighbor lists and bounds-checking `grid` per expansion. The
+    index covers every in-bounds neighbor, so set_tile() only has to touch
+    the mask.
+    """
+    def __init__(self, level):
+        self.grid = [[int(cell) for cell in row] for row in level]
+        self.rows = len(self.grid)
+        self.cols = len(self.grid[0])
+        self.size = self.rows * self.cols
+        self.cells = bytearray(cell for row in self.grid for cell in row)
+        self.walkable = bytearray(cell in WALKABLE for cell in self.cells)
+        self.version = 0  # Bumped whenever a tile changes
+        self.changes = array("i")  # changes[v]: the tile changed by version v + 1
+
+        rows, cols = self.rows, self.cols
+        self.offsets = array("i", [0]) * (self.size + 1)
+        self.neighbors = array("i")
+        for i in range(self.size):
+            x, y = i % cols, i // cols
+            if x > 0:
+                self.neighbors.append(i - 1)
+            if x < cols - 1:
+                self.neighbors.append(i + 1)
+            if y > 0:
+                self.neighbors.append(i - cols)
+            if y < rows - 1:
+                self.neighbors.append(i + cols)
+            self.offsets[i + 1] = len(self.neighbors)
+
+    def index(self, pos):
+        """Return the tile index of (x, y), or -1 if it is off the map."""
+        x, y = pos
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return y * self.cols + x
+        return -1
+
+    def position(self, i):
+        return (i % self.cols, i // self.cols)
+
+    def is_walkable(self, x, y):
+        return 0 <= x < self.cols and 0 <= y < self.rows and self.walkable[y * self.cols + x] == 1
+
+    def exits(self, i):
+        """Yield the walkable neighbors of tile i."""
+        walkable, neighbors = self.walkable, self.neighbors
+        for k in range(self.offsets[i], self.offsets[i + 1]):
+            if walkable[neighbors[k]]:
+                yield neighbors[k]
+
+    def set_tile(self, x, y, value):
+        """Change a tile (e.g. open or close a door)."""
+        i = y * self.cols + x
+        self.grid[y][x] = value
+        self.cells[i] = value
+        self.walkable[i] = value in WALKABLE
+        self.changes.append(i)
+        self.version += 1
+
+    def changed_since(self, version):
+        """Return the positions of the tiles changed after version."""
+        return [self.position(i) for i in self.changes[version:]]
+
+
+def step_out(maze, start, cost):
+    """Return the open neighbor of start with the lowest cost, or None.
+
+    Every navigator uses this when start is not an open tile (e.g. a ghost
+    spawned inside a wall or just past the edge). cost(pos) is the walking
+    distance from pos to the target, negative if it cannot be reached. Ties
+    go to the first neighbor in DIRECTIONS order.
+    """
+    x, y = start
+    best, best_cost = None, INF
+    for dx, dy in DIRECTIONS:
+        pos = (x + dx, y + dy)
+        if maze.is_walkable(*pos):
+            c = cost(pos)
+            if 0 <= c < best_cost:
+                best, best_cost = pos, c
+    return best
+
+
+def path_length(path, start, target):
+    """Length of path(start, target): 0 at the target, -1 if there is none."""
+    if start == target:
+        return 0
+    return len(path(start, target)) or -1
+
+
+class NextHopTable:
+    """All-pairs distance and next-hop table over the walkable tiles of a maze.
+
+    Built once per level; afterwards "next step from A toward B" is a single
+    lookup instead of a fresh search. The table is rebuilt on the next query
+    after a tile changes (the maze version moves on).
+    """
+    def __init__(self, maze):
+        self.maze = maze
+        self.build()
+
+    def build(self):
+        """Compute the table for the maze's current tiles."""
+        maze = self.maze
+        self.version = maze.version
+        # Compact numbering of the walkable tiles
+        self.tiles = [i for i in range(maze.size) if maze.walkable[i]]
+        self.index = array("i", [-1]) * maze.size
+        for k, i in enumerate(self.tiles):
+            self.index[i] = k
+        n = self.size = len(self.tiles)
+
+        # Direction number of a step, keyed by tile index delta
+        steps = {-1: 0, 1: 1, -maze.cols: 2, maze.cols: 3}
+        # links[k] holds (neighbor number, direction from k to neighbor)
+        links = [tuple((self.index[j], steps[j - i]) for j in maze.exits(i)) for i in self.tiles]
+
+        # Row-major by start tile: entry [start * n + target]
+        distances = self.distances = array("i", [-1]) * (n * n)
+        next_hops = self.next_hops = bytearray([NO_DIRECTION]) * (n * n)
+
+        # One BFS flood per target; the BFS parent of every reached tile is its next hop toward the target
+        for target in range(n):
+            distances[target * n + target] = 0
+            queue = deque([target])
+            while queue:
+                current = queue.popleft()
+                dist = distances[current * n + target] + 1
+                for neighbor, d in links[current]:
+                    entry = neighbor * n + target
+                    if distances[entry] < 0:
+                        distances[entry] = dist
+                        # Step from neighbor back toward current is the opposite direction
+                        next_hops[entry] = d ^ 1
+                        queue.append(neighbor)
+
+    def lookup(self, pos):
+        if self.maze.version != self.version:
+            self.build()
+        i = self.maze.index(pos)
+        return self.index[i] if i >= 0 else -1
+
+    def distance(self, start, target):
+        """Return the path length between two tiles, or -1 if unreachable."""
+        i = self.lookup(start)
+        j = self.lookup(target)
+        if i < 0 or j < 0:
+            return -1
+        return self.distances[i * self.size + j]
+
+    def next_step(self, start, target):
+        """Return the tile to move to from start toward target, or None."""
+        i = self.lookup(start)
+        j = self.lookup(target)
+        if j < 0:
+            return None
+        if i < 0:
+            # Stuck on a non-walkable tile (e.g. a spawn inside a wall): step out first
+            return step_out(self.maze, start, lambda p: self.distance(p, target))
+        d = self.next_hops[i * self.size + j]
+        if d == NO_DIRECTION:
+            return None
+        dx, dy = DIRECTIONS[d]
+        return (start[0] + dx, start[1] + dy)
+
+    def path(self, start, target):
+        """Return the full path from start to target (start excluded)."""
+        path = []
+        current = self.next_step(start, target)
+        while current is not None:
+            path.append(current)
+            current = self.next_step(current, target)
+        return path
+
+
+def compile_maze(maze):
+    """Precompute the navigation table for a parsed level."""
+    return NextHopTable(maze)
+
+
+class FlowField:
+    """Distance field toward a single target tile, shared by every ghost.
+
+    The field is one reverse BFS flood from the target and is only rebuilt
+    when the target moves to another tile (or the maze changes); each ghost
+    then steps downhill.
+    """
+    def __init__(self, maze):
+        self.maze = maze
+        self.target = None
+        self.version = None
+        self.distances = array("i", [-1]) * maze.size
+        self._cleared = array("i", [-1]) * maze.size
+
+    def update(self, target):
+        """Re-flood the field if the target changed tile."""
+        maze = self.maze
+        if target == self.target and maze.version == self.version:
+            return
+        self.target = target
+        self.version = maze.version
+        distances = self.distances
+        distances[:] = self._cleared
+        root = maze.index(target)
+        if root < 0 or not maze.walkable[root]:
+            return
+        offsets, neighbors, walkable = maze.offsets, maze.neighbors, maze.walkable
+        distances[root] = 0
+        queue = deque([root])
+        while queue:
+            current = queue.popleft()
+            dist = distances[current] + 1
+            for k in range(offsets[current], offsets[current + 1]):
+                n = neighbors[k]
+                if walkable[n] and distances[n] < 0:
+                    distances[n] = dist
+                    queue.append(n)
+
+    def distance(self, pos):
+        """Return the distance from pos to the current target, or -1."""
+        i = self.maze.index(pos)
+        return self.distances[i] if i >= 0 else -1
+
+    def next_step(self, start, target):
+        """Return the neighbor of start one step closer to target, or None."""
+        self.update(target)
+        dist = self.distance(start)
+        if dist == 0:
+            return None
+        if dist < 0:
+            # Off the field (e.g. a spawn inside a wall): step out first
+            return step_out(self.maze, start, self.distance)
+        x, y = start
+        for dx, dy in DIRECTIONS:
+            if self.distance((x + dx, y + dy)) == dist - 1:
+                return (x + dx, y + dy)
+        return None
+
+
+class IncrementalPlanner:
+    """D* Lite planner that keeps its search between calls.
+
+    Each ghost owns one planner. The search is rooted at the target, so the
+    ghost moving only shifts the heuristic (the km term), and the target
+    moving or a tile changing walkability only re-queues the affected tiles;
+    the previous search is repaired instead of being thrown away. Tiles
+    changed through MazeGrid.set_tile() are repaired on the next plan().
+    """
+    def __init__(self, maze):
+        self.maze = maze
+        self.cols = maze.cols
+        self.version = maze.version
+        self.start = None
+        self.goal = None
+        self.last = None
+        self.km = 0
+        self.offset = 0
+        self.g = []
+        self.rhs = []
+        self.queue = []
+        self.queued = {}
+
+    def heuristic(self, s):
+        """Manhattan distance from the current start to s."""
+        cols, start = self.cols, self.start
+        return abs(s % cols - start % cols) + abs(s // cols - start // cols)
+
+    def calculate_key(self, s):
+        m = min(self.g[s], self.rhs[s])
+        return (m + self.heuristic(s) + self.km, m)
+
+    def push(self, s):
+        key = self.calculate_key(s)
+        self.queued[s] = key
+        heapq.heappush(self.queue, (key[0], key[1], s))
+
+    def top_key(self):
+        # Drop entries superseded by a later push or removal
+        queue, queued = self.queue, self.queued
+        while queue:
+            k1, k2, s = queue[0]
+            if queued.get(s) == (k1, k2):
+                return (k1, k2)
+            heapq.heappop(queue)
+        return (INF, INF)
+
+    def update_vertex(self, s):
+        maze, g = self.maze, self.g
+        if s != self.goal:
+            best = INF
+            if maze.walkable[s]:
+                offsets, neighbors, walkable = maze.offsets, maze.neighbors, maze.walkable
+                for k in range(offsets[s], offsets[s + 1]):
+                    n = neighbors[k]
+                    if walkable[n] and g[n] + 1 < best:
+                        best = g[n] + 1
+            self.rhs[s] = best
+        self.queued.pop(s, None)
+        if g[s] != self.rhs[s]:
+            self.push(s)
+
+    def reset(self, start, goal):
+        """Start a fresh search from start toward goal."""
+        self.g = [INF] * self.maze.size
+        self.rhs = [INF] * self.maze.size
+        self.queue = []
+        self.queued = {}
+        self.km = 0
+        self.offset = 0
+        self.start = self.last = start
+        self.goal = goal
+        self.version = self.maze.version
+        if self.maze.walkable[goal]:
+            self.rhs[goal] = 0
+            self.push(goal)
+
+    def compute_shortest_path(self):
+        g, rhs, start, queued = self.g, self.rhs, self.start, self.queued
+        offsets, neighbors, walkable = self.maze.offsets, self.maze.neighbors, self.maze.walkable
+        update_vertex = self.update_vertex
+        while self.top_key() < self.calculate_key(start) or rhs[start] > g[start]:
+            k1, k2, u = heapq.heappop(self.queue)
+            if queued.get(u) != (k1, k2):
+                continue
+            del queued[u]
+            key = self.calculate_key(u)
+            if (k1, k2) < key:
+                self.push(u)
+                continue
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]
+            else:
+                g[u] = INF
+                update_vertex(u)
+            for k in range(offsets[u], offsets[u + 1]):
+                if walkable[neighbors[k]]:
+                    update_vertex(neighbors[k])
+            if not self.queue:
+                break
+        # Lazy deletion leaves stale heap entries behind; compact when they dominate
+        if len(self.queue) > 4 * len(queued) + 64:
+            self.queue = [(k[0], k[1], s) for s, k in queued.items()]
+            heapq.heapify(self.queue)
+
+    def move_start(self, start):
+        """Record that the searcher has moved to start."""
+        if start == self.start:
+            return
+        self.start = start
+        cols = self.cols
+        self.km += abs(self.last % cols - start % cols) + abs(self.last // cols - start // cols)
+        self.last = start
+
+    def move_goal(self, goal):
+        """Re-root the search at a new goal tile."""
+        old_goal, cols = self.goal, self.cols
+        jump = abs(goal % cols - old_goal % cols) + abs(goal // cols - old_goal // cols)
+        if 2 * jump > self.heuristic(old_goal):
+            # The target jumped far relative to the chase; start over
+            self.reset(self.start, goal)
+            return
+        # Stored values are relative to self.offset. When the target moves a
+        # few tiles most distances shift by about the same amount, so moving
+        # the offset by the expected change keeps them valid; only the root
+        # tiles are re-queued and LPA* repairs whatever moved differently.
+        self.offset += self.heuristic(goal) - self.heuristic(old_goal)
+        self.goal = goal
+        self.update_vertex(old_goal)
+        self.rhs[goal] = -self.offset if self.maze.walkable[goal] else INF
+        self.queued.pop(goal, None)
+        if self.g[goal] != self.rhs[goal]:
+            self.push(goal)
+
+    def update_tile(self, pos):
+        """Repair the search after the walkability of pos changed."""
+        if self.goal is None:
+            return
+        s = self.maze.index(pos)
+        self.update_vertex(s)
+        offsets, neighbors = self.maze.offsets, self.maze.neighbors
+        for k in range(offsets[s], offsets[s + 1]):
+            self.update_vertex(neighbors[k])
+
+    def plan(self, start, target):
+        """Bring the search up to date for start and target."""
+        start = self.maze.index(start)
+        goal = self.maze.index(target)
+        if self.maze.version != self.version:
+            for pos in self.maze.changed_since(self.version):
+                self.update_tile(pos)
+            self.version = self.maze.version
+        if self.goal is None:
+            self.reset(start, goal)
+        else:
+            self.move_start(start)
+            if goal != self.goal:
+                self.move_goal(goal)
+        self.compute_shortest_path()
+
+    def best_neighbor(self, s):
+        g = self.g
+        best, best_cost = None, INF
+        for n in self.maze.exits(s):
+            if g[n] < best_cost:
+                best, best_cost = n, g[n]
+        return best
+
+    def next_step(self, start, target):
+        """Return the tile to move to from start toward target, or None."""
+        maze = self.maze
+        i, goal = maze.index(start), maze.index(target)
+        if goal < 0:
+            return None
+        if i < 0 or not maze.walkable[i]:
+            # Stuck on a non-walkable tile (e.g. a spawn inside a wall): step out first
+            return step_out(maze, start, lambda p: path_length(self.path, p, target))
+        self.plan(start, target)
+        s = self.start
+        if s == self.goal or self.rhs[s] == INF:
+            return None
+        n = self.best_neighbor(s)
+        if n is None:
+            return None
+        return maze.position(n)
+
+    def path(self, start, target):
+        """Return the full path from start to target (start excluded)."""
+        self.plan(start, target)
+        path = []
+        s = self.start
+        if self.rhs[s] == INF:
+            return path
+        while s != self.goal:
+            s = self.best_neighbor(s)
+            if s is None or len(path) >= self.maze.size:
+                return []
+            path.append(self.maze.position(s))
+        return path
+
+
+class HierarchicalPlanner:
+    """Hierarchical pathfinding (HPA*) for mazes too large to search flat.
+
+    The maze is cut into square clusters. Every open run along the border of
+    two clusters gets one entrance: a pair of facing tiles one step apart.
+    Inside a cluster the entrance tiles are joined by their in-cluster walking
+    distance. Queries search this abstract graph and refine only the first
+    hop into tiles. update_tile() rebuilds just the clusters around a tile;
+    tiles changed through MazeGrid.set_tile() are picked up on the next query.
+
+    next_step() keeps each route it finds, keyed by the tile the ghost steps
+    onto, and refines the next leg only when the ghost reaches the end of
+    the current one. The last leg walks down the target's in-cluster
+    distances, so a target moving inside its cluster (or to a neighboring
+    one) needs no new search. At most max_routes routes are kept, least
+    recently used dropped first. hits and misses count steps taken along a
+    kept route and fresh searches.
+    """
+    def __init__(self, maze, cluster_size=16, max_routes=256):
+        self.maze = maze
+        self.version = maze.version
+        self.cluster_size = cluster_size
+        self.max_routes = max_routes
+        self.routes = OrderedDict()  # Tile -> (goal cluster, leg tiles, entrances still ahead)
+        self.hits = 0
+        self.misses = 0
+        self.cluster_cols = -(-maze.cols // cluster_size)
+        self.cluster_rows = -(-maze.rows // cluster_size)
+        self.borders = {}  # (cluster, higher cluster) -> entrance tile pairs
+        self.crossings = {}  # Entrance tile -> facing tiles in other clusters
+        self.edges = {}  # Cluster -> {entrance tile: [(entrance tile, cost), ...]}
+        self.goal_cache = None
+        clusters = range(self.cluster_cols * self.cluster_rows)
+        for c in clusters:
+            for other in self.adjacent_clusters(c):
+                if other > c:
+                    self.build_border(c, other)
+        for c in clusters:
+            self.build_cluster(c)
+
+    def cluster_of(self, i):
+        size = self.cluster_size
+        return (i // self.maze.cols) // size * self.cluster_cols + (i % self.maze.cols) // size
+
+    def bounds(self, c):
+        """Return (x0, y0, x1, y1) of cluster c, upper bounds exclusive."""
+        size = self.cluster_size
+        x0 = c % self.cluster_cols * size
+        y0 = c // self.cluster_cols * size
+        return x0, y0, min(x0 + size, self.maze.cols), min(y0 + size, self.maze.rows)
+
+    def adjacent_clusters(self, c):
+        cx, cy = c % self.cluster_cols, c // self.cluster_cols
+        if cx > 0:
+            yield c - 1
+        if cx < self.cluster_cols - 1:
+            yield c + 1
+        if cy > 0:
+            yield c - self.cluster_cols
+        if cy < self.cluster_rows - 1:
+            yield c + self.cluster_cols
+
+    def build_border(self, a, b):
+        """Place one entrance in the middle of every open run between a and b."""
+        maze, walkable = self.maze, self.maze.walkable
+        x0, y0, x1, y1 = self.bounds(a)
+        if a // self.cluster_cols == b // self.cluster_cols:  # Side by side
+            pairs = [(y * maze.cols + x1 - 1, y * maze.cols + x1) for y in range(y0, y1)]
+        else:
+            pairs = [((y1 - 1) * maze.cols + x, y1 * maze.cols + x) for x in range(x0, x1)]
+        entrances = []
+        run = []
+        for pair in pairs + [None]:
+            if pair is not None and walkable[pair[0]] and walkable[pair[1]]:
+                run.append(pair)
+            elif run:
+                entrances.append(run[len(run) // 2])
+                run = []
+
+        old = self.borders.get((a, b), [])
+        for t1, t2 in old:
+            self.crossings[t1].discard(t2)
+            self.crossings[t2].discard(t1)
+        for t1, t2 in entrances:
+            self.crossings.setdefault(t1, set()).add(t2)
+            self.crossings.setdefault(t2, set()).add(t1)
+        self.borders[(a, b)] = entrances
+        return entrances != old
+
+    def entrances(self, c):
+        """Return the entrance tiles that lie inside cluster c."""
+        tiles = set()
+        for other in self.adjacent_clusters(c):
+            if other > c:
+                tiles.update(t1 for t1, t2 in self.borders[(c, other)])
+            else:
+                tiles.update(t2 for t1, t2 in self.borders[(other, c)])
+        return tiles
+
+    def flood(self, source, c):
+        """BFS from source without leaving cluster c; returns (distances, parents)."""
+        maze = self.maze
+        cols, walkable = maze.cols, maze.walkable
+        offsets, neighbors = maze.offsets, maze.neighbors
+        x0, y0, x1, y1 = self.bounds(c)
+        dist = {source: 0}
+        parents = {source: -1}
+        queue = deque([source])
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            for k in range(offsets[i], offsets[i + 1]):
+                n = neighbors[k]
+                if walkable[n] and n not in dist and x0 <= n % cols < x1 and y0 <= n // cols < y1:
+                    dist[n] = d
+                    parents[n] = i
+                    queue.append(n)
+        return dist, parents
+
+    def build_cluster(self, c):
+        """Recompute the in-cluster distances between the entrances of c."""
+        tiles = self.entrances(c)
+        edges = {}
+        for t in tiles:
+            dist = self.flood(t, c)[0]
+            edges[t] = [(other, dist[other]) for other in tiles if other != t and other in dist]
+        self.edges[c] = edges
+        self.goal_cache = None
+
+    def sync(self):
+        """Repair the graph for every tile changed since the last query."""
+        if self.maze.version != self.version:
+            for pos in self.maze.changed_since(self.version):
+                self.update_tile(pos)
+            self.version = self.maze.version
+
+    def update_tile(self, pos):
+        """Repair the abstract graph after the walkability of pos changed."""
+        self.routes.clear()
+        c = self.cluster_of(self.maze.index(pos))
+        changed = [c]
+        for other in self.adjacent_clusters(c):
+            if self.build_border(min(c, other), max(c, other)):
+                changed.append(other)
+        for k in changed:
+            self.build_cluster(k)
+
+    def goal_distances(self, target):
+        """In-cluster distances to target, kept while the target stays put."""
+        version = self.maze.version
+        if self.goal_cache is None or self.goal_cache[:2] != (target, version):
+            self.goal_cache = (target, version, self.flood(target, self.cluster_of(target))[0])
+        return self.goal_cache[2]
+
+    def route(self, s, t, start_dist):
+        """Return the abstract route from tile s to tile t as a list of tiles.
+
+        start_dist is the in-cluster flood from s. The route lists the
+        entrances passed through, ending with t; start is excluded. Returns
+        None if t cannot be reached.
+        """
+        maze = self.maze
+        cols = maze.cols
+        tx, ty = t % cols, t // cols
+        start_cluster = self.cluster_of(s)
+        goal_dist = self.goal_distances(t)
+
+        # A route that stays inside the start cluster bounds the search
+        best = start_dist.get(t, INF) if start_cluster == self.cluster_of(t) else INF
+        best_node = None
+        g = {}
+        came_from = {}
+        open_list = []
+        for n in self.edges[start_cluster]:
+            if n in start_dist:
+                g[n] = start_dist[n]
+                open_list.append((g[n] + abs(n % cols - tx) + abs(n // cols - ty), g[n], n))
+        heapq.heapify(open_list)
+        while open_list:
+            f, gn, n = heapq.heappop(open_list)
+            if f >= best:
+                break
+            if gn > g[n]:
+                continue
+            if n in goal_dist and gn + goal_dist[n] < best:
+                best = gn + goal_dist[n]
+                best_node = n
+            hops = [(m, 1) for m in self.crossings.get(n, ())]
+            for m, cost in self.edges[self.cluster_of(n)][n] + hops:
+                tentative = gn + cost
+                if tentative < g.get(m, INF):
+                    g[m] = tentative
+                    came_from[m] = n
+                    heapq.heappush(open_list, (tentative + abs(m % cols - tx) + abs(m // cols - ty), tentative, m))
+        if best == INF:
+            return None
+        route = [t]
+        n = best_node
+        while n is not None:
+            if n != t and n != s:
+                route.append(n)
+            n = came_from.get(n)
+        route.reverse()
+        return route
+
+    def refine(self, s, n, parents):
+        """Return the tiles from s to the next route tile n (s excluded).
+
+        parents is the in-cluster flood from s.
+        """
+        if n not in parents:
+            return [n]  # Entrance across the border, one step away
+        tiles = []
+        while n != s:
+            tiles.append(n)
+            n = parents[n]
+        tiles.reverse()
+        return tiles
+
+    def near(self, a, b):
+        """Whether clusters a and b are the same or touch, corners included."""
+        cols = self.cluster_cols
+        return abs(a % cols - b % cols) <= 1 and abs(a // cols - b // cols) <= 1
+
+    def follow(self, s, t, kept):
+        """Take one step from s along a kept route; return the tile or None.
+
+        kept is (goal cluster, leg tiles, entrances still ahead). The step is
+        recorded as the route kept for the tile stepped onto.
+        """
+        goal_cluster, leg, ahead = kept
+        if not leg and ahead:
+            leg = self.refine(s, ahead[0], self.flood(s, self.cluster_of(s))[1])
+            ahead = ahead[1:]
+        if leg:
+            n, leg = leg[0], leg[1:]
+        else:
+            # Last leg: walk down the target's in-cluster distances, crossing
+            # into the target's cluster first if the route ended at its border
+            dist = self.goal_distances(t)
+            here = dist.get(s, INF)
+            n = min((m for m in self.maze.exits(s) if dist.get(m, INF) < here), key=dist.get, default=None)
+            if n is None:
+                return None
+        self.routes[n] = (goal_cluster, leg, ahead)
+        if len(self.routes) > self.max_routes:
+            self.routes.popitem(last=False)
+        return n
+
+    def next_step(self, start, target):
+        """Return the next tile from start toward target, or None."""
+        self.sync()
+        maze = self.maze
+        s = maze.index(start)
+        t = maze.index(target)
+        if t < 0 or not maze.walkable[t] or s == t:
+            return None
+        if s < 0 or not maze.walkable[s]:
+            # Stuck inside a wall (e.g. a spawn point): step out first
+            return step_out(maze, start, lambda p: path_length(self.path, p, target))
+        goal_cluster = self.cluster_of(t)
+        kept = self.routes.pop(s, None)
+        if kept is None and self.cluster_of(s) == goal_cluster and s in self.goal_distances(t):
+            kept = (goal_cluster, [], [])  # Already in the target's cluster: walk down its distances
+        if kept is not None and self.near(kept[0], goal_cluster):
+            n = self.follow(s, t, kept)
+            if n is not None:
+                self.hits += 1
+                return maze.position(n)
+        # No usable route from here: search the abstract graph again
+        self.misses += 1
+        route = self.route(s, t, self.flood(s, self.cluster_of(s))[0])
+        if not route:
+            return None
+        n = self.follow(s, t, (goal_cluster, [], route[:-1]))
+        return maze.position(n) if n is not None else None
+
+    def path(self, start, target):
+        """Return the full path from start to target (start excluded)."""
+        self.sync()
+        maze = self.maze
+        s = maze.index(start)
+        t = maze.index(target)
+        if s < 0 or t < 0 or not maze.walkable[s] or not maze.walkable[t] or s == t:
+            return []
+        route = self.route(s, t, self.flood(s, self.cluster_of(s))[0])
+        if not route:
+            return []
+        tiles = []
+        for n in route:
+            tiles.extend(self.refine(s, n, self.flood(s, self.cluster_of(s))[1]))
+            s = n
+        return [maze.position(i) for i in tiles]
+
+
+class JumpTables:
+    """Goal-independent jump distances for Jump Point Search (JPS+).
+
+    For every tile and direction, a positive entry k means the next jump
+    point is k steps away; an entry -k <= 0 means the run ends at a wall
+    after k walkable steps. Horizontal runs stop where a vertical turn is
+    forced; vertical runs stop where a horizontal run would find a jump
+    point. run_ids number the horizontal walkable runs so a goal on the same
+    run can be spotted without scanning.
+    """
+    def __init__(self, maze):
+        rows, cols, walkable = maze.rows, maze.cols, maze.walkable
+        self.version = maze.version
+        self.run_ids = array("i", [-1]) * maze.size
+        self.horizontal = {-1: array("i", [0]) * maze.size, 1: array("i", [0]) * maze.size}
+        self.vertical = {-1: array("i", [0]) * maze.size, 1: array("i", [0]) * maze.size}
+
+        def open_at(x, y):
+            return 0 <= x < cols and 0 <= y < rows and walkable[y * cols + x]
+
+        run = -1
+        for i in range(maze.size):
+            if walkable[i]:
+                if i % cols == 0 or not walkable[i - 1]:
+                    run += 1
+                self.run_ids[i] = run
+
+        for dx, table in self.horizontal.items():
+            xs = range(cols - 1, -1, -1) if dx == 1 else range(cols)
+            for y in range(rows):
+                for x in xs:
+                    nx = x + dx
+                    if not open_at(nx, y):
+                        table[y * cols + x] = 0
+                    elif (open_at(nx, y - 1) and not open_at(x, y - 1)) or \
+                            (open_at(nx, y + 1) and not open_at(x, y + 1)):
+                        table[y * cols + x] = 1
+                    else:
+                        v = table[y * cols + nx]
+                        table[y * cols + x] = v + 1 if v > 0 else v - 1
+
+        left, right = self.horizontal[-1], self.horizontal[1]
+        for dy, table in self.vertical.items():
+            ys = range(rows - 1, -1, -1) if dy == 1 else range(rows)
+            for x in range(cols):
+                for y in ys:
+                    j = (y + dy) * cols + x
+                    if not open_at(x, y + dy):
+                        table[y * cols + x] = 0
+                    elif left[j] > 0 or right[j] > 0:
+                        table[y * cols + x] = 1
+                    else:
+                        v = table[j]
+                        table[y * cols + x] = v + 1 if v > 0 else v - 1
+
+
+def jump_tables(maze):
+    """Return the JumpTables for maze, rebuilding them if a tile changed."""
+    tables = getattr(maze, "jump_cache", None)
+    if tables is None or tables.version != maze.version:
+        tables = maze.jump_cache = JumpTables(maze)
+    return tables
+
+
+def jump_point_search(start, goal, grid):
+    """Jump Point Search on a uniform-cost 4-connected grid.
+
+    Drop-in for an A* over (start, goal, grid). grid is a MazeGrid, or a
+    list of rows whose WALKABLE tiles are open (wrapped in a MazeGrid on
+    every call, so pass a MazeGrid to reuse the jump tables). Only jump
+    points (tiles where an optimal path may have to turn) go through the
+    open list, and the precomputed tables make each jump O(1). Returns the
+    tile path from start to goal (start excluded, goal included), or [] if
+    there is none.
+    """
+    maze = grid if isinstance(grid, MazeGrid) else MazeGrid(grid)
+    tables = jump_tables(maze)
+    cols, walkable, run_ids = maze.cols, maze.walkable, tables.run_ids
+    horizontal, vertical = tables.horizontal, tables.vertical
+    gx, gy = goal
+    goal_i = maze.index(goal)
+    if goal_i < 0 or not walkable[goal_i] or start == goal:
+        return []
+    goal_run = run_ids[goal_i]
+
+    # Canonical paths move vertically first, so a horizontal run only stops
+    # at the goal or where a vertical turn is forced by a wall behind it
+    def jump_horizontal(x, y, dx):
+        v = horizontal[dx][y * cols + x]
+        if y == gy and 0 < (gx - x) * dx <= abs(v):
+            return goal
+        if v > 0:
+            return (x + dx * v, y)
+        return None
+
+    # A vertical run stops wherever a horizontal run from it would stop,
+    # including the row where the goal shares the horizontal run
+    def jump_vertical(x, y, dy):
+        v = vertical[dy][y * cols + x]
+        if 0 < (gy - y) * dy <= abs(v) and run_ids[gy * cols + x] == goal_run:
+            if v <= 0 or (gy - y) * dy < v:
+                return (x, gy)
+        if v > 0:
+            return (x, y + dy * v)
+        return None
+
+    def successors(node, direction):
+        x, y = node
+        if direction is None:
+            directions = DIRECTIONS
+        elif direction[1] == 0:
+            dx = direction[0]
+            directions = [(dx, 0)]
+            for dy in (-1, 1):
+                if maze.is_walkable(x, y + dy) and not maze.is_walkable(x - dx, y + dy):
+                    directions.append((0, dy))
+        else:
+            directions = ((0, direction[1]), (-1, 0), (1, 0))
+        for dx, dy in directions:
+            if dy == 0:
+                jump = jump_horizontal(x, y, dx)
+            else:
+                jump = jump_vertical(x, y, dy)
+            if jump is not None:
+                yield jump, (dx, dy)
+
+    if not maze.is_walkable(*start):
+        # Off the open grid (e.g. spawned inside a wall): step out first
+        search = lambda a, b: jump_point_search(a, b, maze)
+        step = step_out(maze, start, lambda p: path_length(search, p, goal))
+        return [step] + search(step, goal) if step is not None else []
+
+    # States are (tile, arrival axis) since the pruning depends on it
+    came_from = {}
+    g_score = {(start, None): 0}
+    open_list = [(abs(start[0] - gx) + abs(start[1] - gy), 0, 0, start, None)]
+    counter = 1
+    closed = set()
+    while open_list:
+        _, g, _, node, direction = heapq.heappop(open_list)
+        state = (node, direction and direction[1] == 0)
+        if state in closed:
+            continue
+        closed.add(state)
+        if node == goal:
+            # Expand the jump points back into single tile steps
+            points = [node]
+            while state in came_from:
+                state = came_from[state]
+                points.append(state[0])
+            points.reverse()
+            path = []
+            for (x0, y0), (x1, y1) in zip(points, points[1:]):
+                sx = (x1 > x0) - (x1 < x0)
+                sy = (y1 > y0) - (y1 < y0)
+                while (x0, y0) != (x1, y1):
+                    x0 += sx
+                    y0 += sy
+                    path.append((x0, y0))
+            return path
+        for jump, step in successors(node, direction):
+            next_state = (jump, step[1] == 0)
+            if next_state in closed:
+                continue
+            tentative = g + abs(jump[0] - node[0]) + abs(jump[1] - node[1])
+            if tentative < g_score.get(next_state, INF):
+                g_score[next_state] = tentative
+                came_from[next_state] = state
+                f = tentative + abs(jump[0] - gx) + abs(jump[1] - gy)
+                heapq.heappush(open_list, (f, tentative, counter, jump, step))
+                counter += 1
+    return []
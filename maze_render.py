@@ -0,0 +1,88 @@
+"""Rendering helpers shared by the tile-based Pac-Man games."""
+import pygame
+
+
+class MazeLayer:
+    """Background plus wall and exit tiles, composited once into one surface.
+
+    tiles maps a cell value to its image. The layer is rebuilt only when the
+    maze (or its version) or the tile size changes; every other frame costs a
+    single blit.
+    """
+    def __init__(self, size, background, tiles):
+        self.size = size
+        self.background = background
+        self.tiles = tiles
+        self.surface = None
+        self.key = None
+
+    def render(self, maze, tile_size):
+        """Return the layer surface, rebuilding it if the level changed."""
+        key = (maze, maze.version, tile_size)
+        if self.key is None or self.key[0] is not maze or self.key[1:] != key[1:]:
+            self.surface = self.build(maze, tile_size)
+            self.key = key
+        return self.surface
+
+    def build(self, maze, tile_size):
+        surface = pygame.Surface(self.size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()  # Match the display format for fast blits
+        surface.blit(pygame.transform.scale(self.background, self.size), (0, 0))
+        scaled = {cell: pygame.transform.scale(image, (tile_size, tile_size))
+                  for cell, image in self.tiles.items()}
+        for y, row in enumerate(maze.grid):
+            for x, cell in enumerate(row):
+                if cell in scaled:
+                    surface.blit(scaled[cell], (x * tile_size, y * tile_size))
+        return surface
+
+    def draw(self, screen, maze, tile_size):
+        screen.blit(self.render(maze, tile_size), (0, 0))
+
+
+class DirtyRenderer:
+    """Pushes only the screen regions that changed to the display.
+
+    Each frame, begin() paints the maze layer back over everything drawn
+    the frame before, blit()/mark() record what is drawn now, and present()
+    updates the union of last frame's and this frame's rects. The whole
+    screen is pushed on the first frame and whenever the layer is rebuilt.
+    """
+    def __init__(self, layer):
+        self.layer = layer
+        self.screen = None
+        self.background = None
+        self.previous = []
+        self.current = []
+        self.full = True
+
+    def begin(self, maze, tile_size):
+        self.screen = pygame.display.get_surface()
+        background = self.layer.render(maze, tile_size)
+        if background is not self.background:
+            self.background = background
+            self.full = True
+        if self.full:
+            self.screen.blit(background, (0, 0))
+        else:
+            for rect in self.previous:
+                self.screen.blit(background, rect, rect)
+
+    def blit(self, surface, pos, area=None):
+        rect = self.screen.blit(surface, pos, area)
+        self.current.append(rect)
+        return rect
+
+    def mark(self, rect):
+        """Record a region drawn directly, e.g. by pygame.draw."""
+        self.current.append(pygame.Rect(rect))
+
+    def present(self):
+        if self.full:
+            pygame.display.flip()
+            self.full = False
+        else:
+            pygame.display.update(self.previous + self.current)
+        self.previous = self.current
+        self.current = []
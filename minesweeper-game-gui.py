@@ -6,26 +6,127 @@ import random
 WIDTH = 10
 HEIGHT = 10
 MINES = 10
+CELL_SIZE = 24
+VIEW_COLS = 40  # Largest part of the board shown at once; bigger boards scroll
+VIEW_ROWS = 30
+
+class BoardView:
+    """Draws the visible part of the board on a single tk.Canvas.
+
+    The canvas holds one rectangle and one text item per visible cell. They
+    are created once and reconfigured when cells change or the view scrolls,
+    so the item count does not grow with the board. Clicks are mapped to
+    cells from their coordinates.
+    """
+    def __init__(self, root, game):
+        self.game = game
+        self.cols = min(WIDTH, VIEW_COLS)
+        self.rows = min(HEIGHT, VIEW_ROWS)
+        self.left = 0  # Board cell shown in the top-left corner
+        self.top = 0
+
+        self.canvas = tk.Canvas(root, width=self.cols * CELL_SIZE, height=self.rows * CELL_SIZE,
+                                highlightthickness=0)
+        self.canvas.grid(row=0, column=0)
+        self.items = []
+        for vy in range(self.rows):
+            for vx in range(self.cols):
+                x0, y0 = vx * CELL_SIZE, vy * CELL_SIZE
+                rect = self.canvas.create_rectangle(x0, y0, x0 + CELL_SIZE, y0 + CELL_SIZE, outline='gray')
+                text = self.canvas.create_text(x0 + CELL_SIZE // 2, y0 + CELL_SIZE // 2)
+                self.items.append((rect, text))
+        self.canvas.bind("<Button-1>", lambda event: self.click(event, self.game.reveal))
+        self.canvas.bind("<Button-3>", lambda event: self.click(event, self.game.toggle_flag))
+
+        self.xbar = self.ybar = None
+        if WIDTH > self.cols:
+            self.xbar = tk.Scrollbar(root, orient=tk.HORIZONTAL, command=self.xview)
+            self.xbar.grid(row=1, column=0, sticky='ew')
+        if HEIGHT > self.rows:
+            self.ybar = tk.Scrollbar(root, orient=tk.VERTICAL, command=self.yview)
+            self.ybar.grid(row=0, column=1, sticky='ns')
+            self.canvas.bind("<MouseWheel>", lambda event: self.yview("scroll", -event.delta // 120, "units"))
+            self.canvas.bind("<Button-4>", lambda event: self.yview("scroll", -3, "units"))
+            self.canvas.bind("<Button-5>", lambda event: self.yview("scroll", 3, "units"))
+        self.redraw()
+
+    def click(self, event, action):
+        x = self.left + event.x // CELL_SIZE
+        y = self.top + event.y // CELL_SIZE
+        if 0 <= x < WIDTH and 0 <= y < HEIGHT and not self.game.finished:
+            action(x, y)
+
+    def scrolled(self, args, first, total, visible):
+        """Apply a scrollbar command to the first visible row or column."""
+        if args[0] == "moveto":
+            first = int(float(args[1]) * total)
+        else:
+            first += int(args[1]) * (visible if args[2] == "pages" else 1)
+        return max(0, min(first, total - visible))
+
+    def xview(self, *args):
+        self.left = self.scrolled(args, self.left, WIDTH, self.cols)
+        self.redraw()
+
+    def yview(self, *args):
+        self.top = self.scrolled(args, self.top, HEIGHT, self.rows)
+        self.redraw()
+
+    def draw_cell(self, x, y):
+        cell = self.game.board[y][x]
+        rect, text = self.items[(y - self.top) * self.cols + (x - self.left)]
+        if cell['mine'] and (cell['revealed'] or self.game.finished):
+            label = 'M'
+            color = 'orange' if self.game.won else 'red'
+        elif cell['revealed']:
+            label = str(cell['adjacent_mines']) if cell['adjacent_mines'] > 0 else ""
+            color = 'lightgray'
+        else:
+            label = 'F' if cell['flagged'] else ''
+            color = '#d9d9d9'
+        self.canvas.itemconfig(rect, fill=color)
+        self.canvas.itemconfig(text, text=label)
+
+    def refresh(self, cells):
+        """Redraw the given (x, y) cells that are currently in view."""
+        if len(cells) >= self.cols * self.rows:
+            self.redraw()
+            return
+        for x, y in cells:
+            if self.left <= x < self.left + self.cols and self.top <= y < self.top + self.rows:
+                self.draw_cell(x, y)
+
+    def redraw(self):
+        for y in range(self.top, self.top + self.rows):
+            for x in range(self.left, self.left + self.cols):
+                self.draw_cell(x, y)
+        if self.xbar:
+            self.xbar.set(self.left / WIDTH, (self.left + self.cols) / WIDTH)
+        if self.ybar:
+            self.ybar.set(self.top / HEIGHT, (self.top + self.rows) / HEIGHT)
+
 
 class Minesweeper:
     def __init__(self, root):
         self.root = root
         self.root.title("Minesweeper")
-        
-        self.board = [[{'mine': False, 'revealed': False, 'flagged': False, 'adjacent_mines': 0} 
+
+        self.board = [[{'mine': False, 'revealed': False, 'flagged': False, 'adjacent_mines': 0}
                        for _ in range(WIDTH)] for _ in range(HEIGHT)]
         self.mine_positions = set()
+        self.safe_left = WIDTH * HEIGHT - MINES  # Safe cells still hidden
+        self.finished = False
+        self.won = False
         self.create_board()
         self.place_mines()
         self.calculate_adjacent_mines()
 
-        self.buttons = [[None for _ in range(WIDTH)] for _ in range(HEIGHT)]
-        self.create_buttons()
+        self.view = BoardView(root, self)
 
     def create_board(self):
         # Place mines randomly
         self.mine_positions = set(random.sample(range(WIDTH * HEIGHT), MINES))
-    
+
     def place_mines(self):
         for pos in self.mine_positions:
             x = pos % WIDTH
@@ -33,68 +134,60 @@ class Minesweeper:
             self.board[y][x]['mine'] = True
 
     def calculate_adjacent_mines(self):
-        for y in range(HEIGHT):
-            for x in range(WIDTH):
-                if not self.board[y][x]['mine']:
-                    self.board[y][x]['adjacent_mines'] = sum(
-                        self.board[ny][nx]['mine']
-                        for dx in (-1, 0, 1) if 0 <= x + dx < WIDTH
-                        for dy in (-1, 0, 1) if 0 <= y + dy < HEIGHT
-                        if (dx, dy) != (0, 0)
-                        for nx, ny in [(x + dx, y + dy)]
-                    )
-
-    def create_buttons(self):
-        for y in range(HEIGHT):
-            for x in range(WIDTH):
-                button = tk.Button(self.root, width=2, height=1, command=lambda x=x, y=y: self.reveal(x, y))
-                button.bind("<Button-3>", lambda event, x=x, y=y: self.toggle_flag(x, y))
-                button.grid(row=y, column=x)
-                self.buttons[y][x] = button
+        # Count outward from each mine instead of scanning every cell's neighbors
+        for pos in self.mine_positions:
+            x, y = pos % WIDTH, pos // WIDTH
+            for ny in range(max(y - 1, 0), min(y + 2, HEIGHT)):
+                for nx in range(max(x - 1, 0), min(x + 2, WIDTH)):
+                    if not self.board[ny][nx]['mine']:
+                        self.board[ny][nx]['adjacent_mines'] += 1
 
     def reveal(self, x, y):
         cell = self.board[y][x]
-        if cell['flagged']:
+        if cell['flagged'] or cell['revealed']:
             return
-        
-        cell['revealed'] = True
-        button = self.buttons[y][x]
+
         if cell['mine']:
-            button.config(text="M", bg='red')
+            cell['revealed'] = True
+            self.view.refresh([(x, y)])
             self.game_over(False)
-        else:
-            button.config(text=str(cell['adjacent_mines']) if cell['adjacent_mines'] > 0 else "", bg='lightgray')
-            if cell['adjacent_mines'] == 0:
-                for dx in (-1, 0, 1):
-                    for dy in (-1, 0, 1):
-                        if (dx, dy) != (0, 0):
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < WIDTH and 0 <= ny < HEIGHT and not self.board[ny][nx]['revealed']:
-                                self.reveal(nx, ny)
-        
+            return
+
+        # Flood-fill empty areas with a stack, then redraw once
+        cell['revealed'] = True
+        changed = [(x, y)]
+        stack = [(x, y)]
+        while stack:
+            x, y = stack.pop()
+            if self.board[y][x]['adjacent_mines'] > 0:
+                continue
+            for ny in range(max(y - 1, 0), min(y + 2, HEIGHT)):
+                for nx in range(max(x - 1, 0), min(x + 2, WIDTH)):
+                    neighbor = self.board[ny][nx]
+                    if not neighbor['revealed'] and not neighbor['flagged']:
+                        neighbor['revealed'] = True
+                        changed.append((nx, ny))
+                        stack.append((nx, ny))
+        self.safe_left -= len(changed)
+        self.view.refresh(changed)
+
         if self.check_win():
             self.game_over(True)
 
     def toggle_flag(self, x, y):
         cell = self.board[y][x]
-        button = self.buttons[y][x]
         if not cell['revealed']:
             cell['flagged'] = not cell['flagged']
-            button.config(text='F' if cell['flagged'] else '')
+            self.view.refresh([(x, y)])
 
     def check_win(self):
-        for row in self.board:
-            for cell in row:
-                if not cell['mine'] and not cell['revealed']:
-                    return False
-        return True
+        return self.safe_left == 0
 
     def game_over(self, win):
-        for y in range(HEIGHT):
-            for x in range(WIDTH):
-                self.buttons[y][x].config(state=tk.DISABLED)
-                if self.board[y][x]['mine']:
-                    self.buttons[y][x].config(text='M', bg='orange' if win else 'red')
+        # Clicks are ignored from now on; mines are shown on the next redraw
+        self.finished = True
+        self.won = win
+        self.view.redraw()
         if win:
             messagebox.showinfo("Congratulations!", "You've won!")
         else:
@@ -103,4 +196,4 @@ class Minesweeper:
 if __name__ == "__main__":
     root = tk.Tk()
     game = Minesweeper(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
@@ -0,0 +1,38 @@
+"""Fixed-capacity pools of reusable game objects."""
+
+
+class ObjectPool:
+    """A preallocated set of objects handed out and taken back via a free list.
+
+    Every object is built once by factory() when the pool is created.
+    acquire() pops one off the free list and calls its reset() so it looks
+    freshly spawned; release() pushes it back. When every object is in use
+    acquire() returns None instead of allocating. active and high_water (the
+    most objects ever in use at once) are kept for monitoring.
+    """
+    def __init__(self, factory, capacity):
+        self.objects = [factory() for _ in range(capacity)]
+        self.free = list(self.objects)
+        self.active = 0
+        self.high_water = 0
+
+    def acquire(self):
+        if not self.free:
+            return None
+        obj = self.free.pop()
+        obj.reset()
+        self.active += 1
+        self.high_water = max(self.high_water, self.active)
+        return obj
+
+    def release(self, obj):
+        self.free.append(obj)
+        self.active -= 1
+
+    def clear(self):
+        """Return every object to the free list, e.g. when a new game starts."""
+        self.free = list(self.objects)
+        self.active = 0
+
+    def stats(self):
+        return {"active": self.active, "high_water": self.high_water, "capacity": len(self.objects)}
@@ -6,6 +6,8 @@
 
 import pygame
 import random
+from text_cache import render_text
+from shape_cache import draw_circle
 
 # Initialize Pygame
 pygame.init()
@@ -58,7 +60,7 @@ class PacMan:
         self.y = max(self.radius, min(self.y, HEIGHT - self.radius))
 
     def draw(self):
-        pygame.draw.circle(screen, YELLOW, (self.x, self.y), self.radius)
+        draw_circle(screen, YELLOW, (self.x, self.y), self.radius)
 
 # Ghost class with Q-learning AI
 class Ghost:
@@ -141,7 +143,7 @@ class Ghost:
             self.epsilon *= self.epsilon_decay
 
     def draw(self):
-        pygame.draw.circle(screen, self.color, (self.x, self.y), self.radius)
+        draw_circle(screen, self.color, (self.x, self.y), self.radius)
 
 # Pellet class
 class Pellet:
@@ -151,7 +153,7 @@ class Pellet:
         self.radius = 5
 
     def draw(self):
-        pygame.draw.circle(screen, WHITE, (self.x, self.y), self.radius)
+        draw_circle(screen, WHITE, (self.x, self.y), self.radius)
 
 # Create game objects
 pacman = PacMan()
@@ -204,7 +206,7 @@ while running:
         pellet.draw()
 
     # Draw score
-    score_text = font.render(f"Score: {score}", True, WHITE)
+    score_text = render_text(font, f"Score: {score}", WHITE)
     screen.blit(score_text, (10, 10))
 
     # Update display
@@ -1,6 +1,8 @@
 import pygame
 import random
-import heapq
+from maze_nav import MazeGrid, jump_point_search
+from text_cache import render_text
+from shape_cache import draw_circle
 
 # Initialize Pygame
 pygame.init()
@@ -26,8 +28,8 @@ score = 0
 # Load fonts
 font = pygame.font.SysFont("Arial", 24)
 
-def heuristic(a, b):
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+# Open arena grid for pathfinding
+grid = MazeGrid([[0 for _ in range(WIDTH // CELL_SIZE)] for _ in range(HEIGHT // CELL_SIZE)])
 
 # Pac-Man class
 class PacMan:
@@ -53,9 +55,9 @@ class PacMan:
         self.y = max(self.radius, min(self.y, HEIGHT - self.radius))
 
     def draw(self):
-        pygame.draw.circle(screen, YELLOW, (self.x, self.y), self.radius)
+        draw_circle(screen, YELLOW, (self.x, self.y), self.radius)
 
-# Ghost class with A* pathfinding
+# Ghost class with Jump Point Search pathfinding
 class Ghost:
     def __init__(self, color):
         self.x = random.randint(0, WIDTH // CELL_SIZE) * CELL_SIZE
@@ -68,40 +70,7 @@ class Ghost:
     def astar_pathfinding(self, target_x, target_y):
         start = (self.x // CELL_SIZE, self.y // CELL_SIZE)
         goal = (target_x // CELL_SIZE, target_y // CELL_SIZE)
-        
-        frontier = []
-        heapq.heappush(frontier, (0, start))
-        came_from = {}
-        cost_so_far = {}
-        came_from[start] = None
-        cost_so_far[start] = 0
-        
-        while frontier:
-            _, current = heapq.heappop(frontier)
-            if current == goal:
-                break
-            
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                next_pos = (current[0] + dx, current[1] + dy)
-                if 0 <= next_pos[0] < WIDTH // CELL_SIZE and 0 <= next_pos[1] < HEIGHT // CELL_SIZE:
-                    new_cost = cost_so_far[current] + 1
-                    if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
-                        cost_so_far[next_pos] = new_cost
-                        priority = new_cost + heuristic(goal, next_pos)
-                        heapq.heappush(frontier, (priority, next_pos))
-                        came_from[next_pos] = current
-        
-        path = []
-        current = goal
-        while current != start:
-            if current in came_from:
-                path.append(current)
-                current = came_from[current]
-            else:
-                break
-        
-        path.reverse()
-        return path
+        return jump_point_search(start, goal, grid)
 
     def move_towards(self, target_x, target_y):
         if not self.path or (self.x // CELL_SIZE, self.y // CELL_SIZE) == self.path[0]:
@@ -113,7 +82,7 @@ class Ghost:
             self.y = next_pos[1] * CELL_SIZE
 
     def draw(self):
-        pygame.draw.circle(screen, self.color, (self.x, self.y), self.radius)
+        draw_circle(screen, self.color, (self.x, self.y), self.radius)
 
 # Pellet class
 class Pellet:
@@ -123,7 +92,7 @@ class Pellet:
         self.radius = 5
 
     def draw(self):
-        pygame.draw.circle(screen, WHITE, (self.x, self.y), self.radius)
+        draw_circle(screen, WHITE, (self.x, self.y), self.radius)
 
 # Create game objects
 pacman = PacMan()
@@ -153,7 +122,7 @@ while running:
     # Move Pac-Man
     pacman.move()
 
-    # Move ghosts using A*
+    # Move ghosts using Jump Point Search
     for ghost in ghosts:
         ghost.move_towards(pacman.x, pacman.y)
 
@@ -176,7 +145,7 @@ while running:
         pellet.draw()
 
     # Draw score
-    score_text = font.render(f"Score: {score}", True, WHITE)
+    score_text = render_text(font, f"Score: {score}", WHITE)
     screen.blit(score_text, (10, 10))
 
     # Update display
@@ -1,15 +1,17 @@
 # Explanation of Changes:
-# A Pathfinding*: The astar() function calculates the optimal path for the ghost to move towards Pac-Man.
+# Jump Point Search: jump_point_search() (maze_nav) calculates a shortest path for the ghost to move towards Pac-Man.
 # Q-learning: The ghost uses Q-learning to decide its actions. It updates its Q-table with rewards based on the ghost’s state and action.
-# Combining A and Q-learning*: The ghost uses A* to determine the best short-term movement, while Q-learning improves the ghost's decision-making over time based on past experiences.
+# Combining JPS and Q-learning: The ghost uses Jump Point Search to determine the best short-term movement, while Q-learning improves the ghost's decision-making over time based on past experiences.
 #
 # Key Improvements:
-# Faster Movement: The ghost now moves more efficiently towards Pac-Man by combining both A* for navigation and Q-learning for decision-making.
+# Faster Movement: The ghost now moves more efficiently towards Pac-Man by combining both Jump Point Search for navigation and Q-learning for decision-making.
 # Better Exploration/Exploitation: The ghost explores the environment but gradually exploits learned behaviors for better strategy over time.
 
 import pygame
 import random
-import heapq
+from maze_nav import MazeGrid, jump_point_search
+from text_cache import render_text
+from shape_cache import draw_circle
 
 # Initialize Pygame
 pygame.init()
@@ -35,45 +37,6 @@ score = 0
 # Load fonts
 font = pygame.font.SysFont("Arial", 24)
 
-# A* heuristic function
-def heuristic(a, b):
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-# A* Pathfinding Algorithm
-def astar(start, goal, grid):
-    open_list = []
-    closed_list = set()
-    came_from = {}
-    g_score = {start: 0}
-    f_score = {start: heuristic(start, goal)}
-
-    heapq.heappush(open_list, (f_score[start], start))
-
-    while open_list:
-        _, current = heapq.heappop(open_list)
-
-        if current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.reverse()
-            return path
-
-        closed_list.add(current)
-
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            neighbor = (current[0] + dx, current[1] + dy)
-            if 0 <= neighbor[0] < WIDTH // CELL_SIZE and 0 <= neighbor[1] < HEIGHT // CELL_SIZE and neighbor not in closed_list:
-                tentative_g_score = g_score[current] + 1
-                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + heuristic(neighbor, goal)
-                    heapq.heappush(open_list, (f_score[neighbor], neighbor))
-
-    return []  # Return an empty list if no path is found
-
 # Pac-Man class
 class PacMan:
     def __init__(self):
@@ -98,9 +61,9 @@ class PacMan:
         self.y = max(self.radius, min(self.y, HEIGHT - self.radius))
 
     def draw(self):
-        pygame.draw.circle(screen, YELLOW, (self.x, self.y), self.radius)
+        draw_circle(screen, YELLOW, (self.x, self.y), self.radius)
 
-# Ghost class with Q-learning and A* integration
+# Ghost class with Q-learning and Jump Point Search integration
 class Ghost:
     def __init__(self, color):
         self.x = random.randint(0, WIDTH // CELL_SIZE) * CELL_SIZE
@@ -148,10 +111,10 @@ class Ghost:
         state = self.get_state(pacman_x, pacman_y)
         action = self.get_action(state)
 
-        # Use A* to find the shortest path to Pac-Man
+        # Use Jump Point Search to find the shortest path to Pac-Man
         start = (self.x // CELL_SIZE, self.y // CELL_SIZE)
         goal = (pacman_x // CELL_SIZE, pacman_y // CELL_SIZE)
-        path = astar(start, goal, grid)
+        path = jump_point_search(start, goal, grid)
 
         # If a path is found, move to the next point on the path
         if path:
@@ -174,7 +137,7 @@ class Ghost:
             self.epsilon *= self.epsilon_decay
 
     def draw(self):
-        pygame.draw.circle(screen, self.color, (self.x, self.y), self.radius)
+        draw_circle(screen, self.color, (self.x, self.y), self.radius)
 
 # Pellet class
 class Pellet:
@@ -184,15 +147,15 @@ class Pellet:
         self.radius = 5
 
     def draw(self):
-        pygame.draw.circle(screen, WHITE, (self.x, self.y), self.radius)
+        draw_circle(screen, WHITE, (self.x, self.y), self.radius)
 
 # Create game objects
 pacman = PacMan()
 ghosts = [Ghost(RED), Ghost(BLUE)]  # Two AI ghosts
 pellets = [Pellet() for _ in range(20)]
 
-# Create grid for A* pathfinding
-grid = [[0 for _ in range(WIDTH // CELL_SIZE)] for _ in range(HEIGHT // CELL_SIZE)]
+# Create grid for pathfinding (jump tables are built once and reused)
+grid = MazeGrid([[0 for _ in range(WIDTH // CELL_SIZE)] for _ in range(HEIGHT // CELL_SIZE)])
 
 # Game loop
 clock = pygame.time.Clock()
@@ -217,7 +180,7 @@ while running:
     # Move Pac-Man
     pacman.move()
 
-    # Move ghosts using Q-learning and A* combined
+    # Move ghosts using Q-learning and Jump Point Search combined
     for ghost in ghosts:
         ghost.move_towards(pacman.x, pacman.y, grid)
 
@@ -240,7 +203,7 @@ while running:
         pellet.draw()
 
     # Draw score
-    score_text = font.render(f"Score: {score}", True, WHITE)
+    score_text = render_text(font, f"Score: {score}", WHITE)
     screen.blit(score_text, (10, 10))
 
     # Update display
@@ -1,5 +1,5 @@
 import pygame
-from collections import deque
+from maze_nav import MazeGrid, IncrementalPlanner
 
 # Initialize Pygame
 pygame.init()
@@ -45,10 +45,10 @@ LEVEL = [
     "11110000000000002111",  # Exit is at the bottom-right corner
     "11111111111111111111"
 ]
-ROWS, COLS = len(LEVEL), len(LEVEL[0])
 
 # Load game map as a grid
-grid = [[int(cell) for cell in row] for row in LEVEL]
+MAZE = MazeGrid(LEVEL)  # Flat walkability mask and neighbor index
+grid = MAZE.grid
 
 # Define helper functions for drawing
 def draw_grid():
@@ -59,38 +59,6 @@ def draw_grid():
             elif cell == 2:  # Draw the exit door
                 pygame.draw.rect(screen, GREEN, (x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
 
-def get_neighbors(pos):
-    x, y = pos
-    neighbors = []
-    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < COLS and 0 <= ny < ROWS and grid[ny][nx] in (0, 2):  # Allow paths and exit
-            neighbors.append((nx, ny))
-    return neighbors
-
-def bfs(start, target):
-    """A simple Breadth-First Search to find the shortest path."""
-    queue = deque([start])
-    came_from = {start: None}
-    while queue:
-        current = queue.popleft()
-
-        if current == target:
-            break
-
-        for neighbor in get_neighbors(current):
-            if neighbor not in came_from:
-                queue.append(neighbor)
-                came_from[neighbor] = current
-
-    # Reconstruct path
-    path = []
-    current = target
-    while current is not None:
-        path.append(current)
-        current = came_from.get(current)
-    return path[::-1]  # Return reversed path
-
 # Define Pac-Man class
 class PacMan:
     def __init__(self, x, y):
@@ -101,7 +69,7 @@ class PacMan:
     def move(self):
         new_x = self.x + self.direction[0]
         new_y = self.y + self.direction[1]
-        if 0 <= new_x < COLS and 0 <= new_y < ROWS and grid[new_y][new_x] != 1:
+        if MAZE.is_walkable(new_x, new_y):
             self.x = new_x
             self.y = new_y
 
@@ -114,7 +82,7 @@ class Ghost:
         self.x = x
         self.y = y
         self.color = color
-        self.path = []
+        self.planner = IncrementalPlanner(MAZE)  # Keeps its search between moves
         self.counter = 0  # Delay mechanism for ghost movement
 
     def move(self, target):
@@ -123,10 +91,8 @@ class Ghost:
             self.counter += 1
             return
         self.counter = 0
-        if not self.path or (self.x, self.y) == self.path[0]:
-            self.path = bfs((self.x, self.y), target)
-        if self.path:
-            next_step = self.path.pop(0)
+        next_step = self.planner.next_step((self.x, self.y), target)
+        if next_step:
             self.x, self.y = next_step
 
     def draw(self):
@@ -1,6 +1,11 @@
+import argparse
 import pygame
 import sys
-from collections import deque
+import headless
+from maze_render import MazeLayer, DirtyRenderer
+from asset_loader import load_image, SpriteAtlas, Animation
+from maze_nav import MazeGrid, FlowField, HierarchicalPlanner, load_level
+from text_cache import render_text
 
 # Initialize Pygame
 pygame.init()
@@ -13,11 +18,14 @@ TILE_SIZE = 32
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 
-# Initialize screen
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Police and Innocent Man with Power Up feature")
+# Initialize screen (no window when running headless)
+SESSION = headless.start_session()
+if SESSION is None:
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Police and Innocent Man with Power Up feature")
 clock = pygame.time.Clock()
 FPS = 10
+HPA_MIN_TILES = 10000  # Mazes this large switch ghosts to hierarchical pathfinding
 
 # Game level (1 = wall, 0 = path, 2 = exit)
 LEVEL = [
@@ -40,22 +48,43 @@ LEVEL = [
     "11110000000000002111",
     "11111111111111111111"
 ]
-ROWS, COLS = len(LEVEL), len(LEVEL[0])
-grid = [[int(cell) for cell in row] for row in LEVEL]
+
+# A custom (e.g. much larger) level can be loaded instead with --level FILE;
+# the window shows its top-left corner
+parser = argparse.ArgumentParser(add_help=False)
+parser.add_argument("--level")
+LEVEL_FILE = parser.parse_known_args()[0].level
+if LEVEL_FILE:
+    LEVEL = load_level(LEVEL_FILE)
+MAZE = MazeGrid(LEVEL)  # Flat walkability mask and neighbor index
+grid = MAZE.grid
+
+# Ghost navigation shared by all ghosts: a distance field toward Pac-Man on
+# small mazes, cluster-level (HPA*) routes once re-flooding gets too costly
+if MAZE.size < HPA_MIN_TILES:
+    NAVIGATOR = FlowField(MAZE)
+else:
+    NAVIGATOR = HierarchicalPlanner(MAZE)
 
 # Load game assets
-PACMAN_FRAMES = [
-    pygame.image.load("assets/man1.png"), 
-    pygame.image.load("assets/man2.png"), 
-]
-GHOST_SPRITES = {
-    "red": pygame.image.load("assets/police1.png"), 
-    "blue": pygame.image.load("assets/police3.png")
-}
-WALL_TILE = pygame.image.load("assets/fence.png")
-EXIT_TILE = pygame.image.load("assets/exit_tile.png")
-POWER_ICON = pygame.image.load("assets/power.png")
-BACKGROUND_IMAGE = pygame.image.load("assets/background.png")
+# Character and icon frames, pre-scaled to the tile size and packed into one surface
+TILE = (TILE_SIZE, TILE_SIZE)
+SPRITES = SpriteAtlas({
+    "man1": ("assets/man1.png", TILE),  # Mouth open
+    "man2": ("assets/man2.png", TILE),  # Mouth closed
+    "red": ("assets/police1.png", TILE),
+    "blue": ("assets/police3.png", TILE),
+    "power": ("assets/power.png", TILE),
+})
+WALL_TILE = load_image("assets/fence.png")
+EXIT_TILE = load_image("assets/exit_tile.png")
+BACKGROUND_IMAGE = load_image("assets/background.png")
+
+# Background, walls and exit, rendered once and reused every frame
+MAZE_LAYER = MazeLayer((WIDTH, HEIGHT), BACKGROUND_IMAGE, {1: WALL_TILE, 2: EXIT_TILE})
+
+# Redraws only the tiles and UI regions that change between frames
+RENDERER = DirtyRenderer(MAZE_LAYER)
 
 # UI font
 FONT = pygame.font.Font(None, 36)
@@ -66,20 +95,19 @@ class PacMan:
         self.x = x
         self.y = y
         self.direction = (0, 0)
-        self.frame = 0
+        self.animation = Animation(("man1", "man2"), 10)
 
     def move(self):
         new_x = self.x + self.direction[0]
         new_y = self.y + self.direction[1]
-        if 0 <= new_x < COLS and 0 <= new_y < ROWS and grid[new_y][new_x] != 1:
+        if MAZE.is_walkable(new_x, new_y):
             self.x = new_x
             self.y = new_y
 
     def draw(self):
         # Alternate between open and closed mouth every frame
-        sprite = PACMAN_FRAMES[self.frame // 10 % len(PACMAN_FRAMES)]
-        screen.blit(pygame.transform.scale(sprite, (TILE_SIZE, TILE_SIZE)), (self.x * TILE_SIZE, self.y * TILE_SIZE))
-        self.frame += 1
+        SPRITES.draw(RENDERER, self.animation.frame(), (self.x * TILE_SIZE, self.y * TILE_SIZE))
+        self.animation.advance()
 
 
 class Ghost:
@@ -88,8 +116,6 @@ class Ghost:
         self.x = x
         self.y = y
         self.color = color
-        self.sprite = pygame.transform.scale(GHOST_SPRITES[color], (TILE_SIZE, TILE_SIZE))
-        self.path = []
         self.counter = 0
 
     def move(self, target):
@@ -97,68 +123,25 @@ class Ghost:
             self.counter += 1
             return
         self.counter = 0
-        if not self.path or (self.x, self.y) == self.path[0]:
-            self.path = self.bfs((self.x, self.y), target)
-        if self.path:
-            next_step = self.path.pop(0)
+        next_step = NAVIGATOR.next_step((self.x, self.y), target)
+        if next_step:
             self.x, self.y = next_step
 
-    def bfs(self, start, target):
-        """Breadth-First Search to find shortest path."""
-        queue = deque([start])
-        came_from = {start: None}
-        while queue:
-            current = queue.popleft()
-            if current == target:
-                break
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in came_from:
-                    queue.append(neighbor)
-                    came_from[neighbor] = current
-        # Reconstruct path
-        path = []
-        current = target
-        while current is not None:
-            path.append(current)
-            current = came_from.get(current)
-        return path[::-1]  # Reverse path
-
-    def get_neighbors(self, pos):
-        """Return valid neighboring positions."""
-        x, y = pos
-        neighbors = []
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < COLS and 0 <= ny < ROWS and grid[ny][nx] in (0, 2):  # Walkable tiles
-                neighbors.append((nx, ny))
-        return neighbors
-
     def draw(self):
-        screen.blit(self.sprite, (self.x * TILE_SIZE, self.y * TILE_SIZE))
-
+        SPRITES.draw(RENDERER, self.color, (self.x * TILE_SIZE, self.y * TILE_SIZE))
 
-def draw_background():
-    """Draw the background image."""
-    screen.blit(pygame.transform.scale(BACKGROUND_IMAGE, (WIDTH, HEIGHT)), (0, 0))
 
-
-def draw_grid():
-    """Render the level layout with wall and exit tiles."""
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell == 1:  # Wall
-                screen.blit(pygame.transform.scale(WALL_TILE, (TILE_SIZE, TILE_SIZE)), (x * TILE_SIZE, y * TILE_SIZE))
-            elif cell == 2:  # Exit door
-                screen.blit(pygame.transform.scale(EXIT_TILE, (TILE_SIZE, TILE_SIZE)), (x * TILE_SIZE, y * TILE_SIZE))
+def draw_maze():
+    """Restore the cached background and level layout under last frame's sprites."""
+    RENDERER.begin(MAZE, TILE_SIZE)
 
 
 def draw_ui(score, lives):
     """Render UI showing score and lives."""
-    score_text = FONT.render(f"Score: {score}", True, WHITE)
-    screen.blit(score_text, (10, HEIGHT - 40))
+    score_text = render_text(FONT, f"Score: {score}", WHITE)
+    RENDERER.blit(score_text, (10, HEIGHT - 40))
     for i in range(lives):
-        screen.blit(pygame.transform.scale(PACMAN_FRAMES[0], (TILE_SIZE, TILE_SIZE)),
-                    (WIDTH - (i + 1) * TILE_SIZE - 10, HEIGHT - 40))
+        SPRITES.draw(RENDERER, "man1", (WIDTH - (i + 1) * TILE_SIZE - 10, HEIGHT - 40))
 
 
 def main():
@@ -175,18 +158,22 @@ def main():
     running = True
 
     while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    pacman.direction = (0, -1)
-                elif event.key == pygame.K_DOWN:
-                    pacman.direction = (0, 1)
-                elif event.key == pygame.K_LEFT:
-                    pacman.direction = (-1, 0)
-                elif event.key == pygame.K_RIGHT:
-                    pacman.direction = (1, 0)
+        if SESSION:
+            # Scripted input instead of keyboard events
+            pacman.direction = SESSION.next_direction(pacman.direction)
+        else:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_UP:
+                        pacman.direction = (0, -1)
+                    elif event.key == pygame.K_DOWN:
+                        pacman.direction = (0, 1)
+                    elif event.key == pygame.K_LEFT:
+                        pacman.direction = (-1, 0)
+                    elif event.key == pygame.K_RIGHT:
+                        pacman.direction = (1, 0)
 
         # Update Pac-Man
         pacman.move()
@@ -208,19 +195,27 @@ def main():
                     print("Game Over!")
                     running = False
 
+        if SESSION:
+            # Headless runs skip drawing and frame limiting
+            running = SESSION.tick() and running
+            continue
+
         # Draw everything
-        draw_background()  # Draw the background
-        draw_grid()        # Draw level layout
+        draw_maze()  # Background and level layout
         pacman.draw()
         for ghost in ghosts:
             ghost.draw()
         if power_icon_position:
-            screen.blit(pygame.transform.scale(POWER_ICON, (TILE_SIZE, TILE_SIZE)), (power_icon_position[0] * TILE_SIZE, power_icon_position[1] * TILE_SIZE))
+            SPRITES.draw(RENDERER, "power", (power_icon_position[0] * TILE_SIZE, power_icon_position[1] * TILE_SIZE))
         draw_ui(score, lives)
 
-        pygame.display.flip()
+        RENDERER.present()  # Push only the changed regions
         clock.tick(FPS)
 
+    if SESSION:
+        SESSION.report()
+        if isinstance(NAVIGATOR, HierarchicalPlanner):
+            print(f"ghost routes: {NAVIGATOR.hits} steps reused, {NAVIGATOR.misses} searches")
     pygame.quit()
     sys.exit()
 
@@ -1,6 +1,7 @@
 import pygame
 import numpy as np
 import random
+from text_cache import get_font, render_text
 
 # Initialize Pygame
 pygame.init()
@@ -153,8 +154,8 @@ def main():
         food.draw()
 
         # Display score
-        font = pygame.font.SysFont(None, 36)
-        score_text = font.render(f"Score: {pacman.score}", True, WHITE)
+        font = get_font(None, 36, sysfont=True)
+        score_text = render_text(font, f"Score: {pacman.score}", WHITE)
         screen.blit(score_text, (10, 10))
 
         pygame.display.flip()
@@ -1,5 +1,7 @@
 import pygame
 import random
+from text_cache import render_text
+from shape_cache import draw_circle, draw_pacman
 
 # Initialize Pygame
 pygame.init()
@@ -49,28 +51,8 @@ class PacMan:
         self.y = max(self.radius, min(self.y, HEIGHT - self.radius))
 
     def draw(self):
-        # Draw Pac-Man as a circle with a mouth
-        pygame.draw.circle(screen, YELLOW, (self.x, self.y), self.radius)
-        # Draw the mouth based on direction
-        if self.direction == "right":
-            start_angle = 0.78  # 45 degrees
-            end_angle = 5.49    # 315 degrees
-        elif self.direction == "left":
-            start_angle = 3.92  # 225 degrees
-            end_angle = 2.35    # 135 degrees
-        elif self.direction == "up":
-            start_angle = 5.49  # 315 degrees
-            end_angle = 3.92    # 225 degrees
-        elif self.direction == "down":
-            start_angle = 2.35  # 135 degrees
-            end_angle = 0.78    # 45 degrees
-        pygame.draw.polygon(screen, BLACK, [
-            (self.x, self.y),
-            (self.x + self.radius * pygame.math.Vector2(1, 0).rotate(start_angle * 57.3).x,
-             self.y + self.radius * pygame.math.Vector2(1, 0).rotate(start_angle * 57.3).y),
-            (self.x + self.radius * pygame.math.Vector2(1, 0).rotate(end_angle * 57.3).x,
-             self.y + self.radius * pygame.math.Vector2(1, 0).rotate(end_angle * 57.3).y)
-        ])
+        # Draw Pac-Man as a circle with a mouth facing its direction
+        draw_pacman(screen, (self.x, self.y), self.radius, self.direction, YELLOW, BLACK)
 
 # Ghost class
 class Ghost:
@@ -102,7 +84,7 @@ class Ghost:
             self.direction = random.choice(["left", "right", "up", "down"])
 
     def draw(self):
-        pygame.draw.circle(screen, self.color, (self.x, self.y), self.radius)
+        draw_circle(screen, self.color, (self.x, self.y), self.radius)
 
 # Pellet class
 class Pellet:
@@ -112,7 +94,7 @@ class Pellet:
         self.radius = 5
 
     def draw(self):
-        pygame.draw.circle(screen, WHITE, (self.x, self.y), self.radius)
+        draw_circle(screen, WHITE, (self.x, self.y), self.radius)
 
 # Create game objects
 pacman = PacMan()
@@ -165,7 +147,7 @@ while running:
         pellet.draw()
 
     # Draw score
-    score_text = font.render(f"Score: {score}", True, WHITE)
+    score_text = render_text(font, f"Score: {score}", WHITE)
     screen.blit(score_text, (10, 10))
 
     # Update display
@@ -0,0 +1,67 @@
+"""Vertically scrolling backdrop with optional parallax layers."""
+import pygame
+from asset_loader import paste
+
+
+class ScrollingBackground:
+    """A wrapping backdrop that scrolls down the screen.
+
+    The image is cropped (or scaled up) to the screen width once and kept in
+    the display format. Each frame it is drawn as at most two strips, the
+    tail of the image above its head, so the backdrop costs exactly one
+    screen-sized blit and needs no fill underneath. Parallax layers are
+    pre-rendered transparent tiles repeated across the screen width; each
+    scrolls at its own speed on top of the backdrop.
+    """
+    def __init__(self, image, size, speed=1):
+        self.size = size
+        self.image = self.prepare(image, size, pygame.SRCALPHA & image.get_flags())
+        self.speed = speed
+        self.offset = 0
+        self.layers = []  # [surface, speed, offset]
+
+    def prepare(self, image, size, alpha):
+        width, height = size
+        if image.get_width() < width or image.get_height() < height:
+            scale = max(width / image.get_width(), height / image.get_height())
+            image = pygame.transform.scale(image, (int(image.get_width() * scale + 0.5),
+                                                   int(image.get_height() * scale + 0.5)))
+        image = image.subsurface((0, 0, width, image.get_height())).copy()
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha() if alpha else image.convert()
+        return image
+
+    def add_layer(self, tile, speed):
+        """Add a parallax layer made by repeating tile across the screen width."""
+        width = self.size[0]
+        strip = pygame.Surface((width, tile.get_height()), pygame.SRCALPHA)
+        for x in range(0, width, tile.get_width()):
+            paste(strip, tile, (x, 0))
+        # Stack the strip until it is at least a screen tall so it can wrap
+        rows = -(-self.size[1] // tile.get_height())
+        layer = pygame.Surface((width, rows * tile.get_height()), pygame.SRCALPHA)
+        for y in range(0, layer.get_height(), tile.get_height()):
+            paste(layer, strip, (0, y))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert_alpha()
+        self.layers.append([layer, speed, 0])
+
+    def scroll(self):
+        """Advance the backdrop and every layer by one frame."""
+        self.offset = (self.offset + self.speed) % self.image.get_height()
+        for layer in self.layers:
+            layer[2] = (layer[2] + layer[1]) % layer[0].get_height()
+
+    def draw(self, screen):
+        self.draw_wrapped(screen, self.image, int(self.offset))
+        for surface, _, offset in self.layers:
+            self.draw_wrapped(screen, surface, int(offset))
+
+    def draw_wrapped(self, screen, image, offset):
+        """Blit image shifted down by offset, wrapping its tail to the top."""
+        width, height = self.size
+        top = min(offset, height)
+        if top:
+            screen.blit(image, (0, 0), (0, image.get_height() - offset, width, top))
+        if top < height:
+            screen.blit(image, (0, top), (0, 0, width, height - top))
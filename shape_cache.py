@@ -0,0 +1,61 @@
+"""Pre-rendered procedural shapes for the vector-drawn Pac-Man games.
+
+Each shape is drawn once per (shape, direction, radius, color) onto a small
+transparent surface; drawing it again is a single blit.
+"""
+import pygame
+
+# Mouth edges (radians) for each direction Pac-Man can face
+MOUTH_ANGLES = {
+    "right": (0.78, 5.49),  # 45 to 315 degrees
+    "left": (3.92, 2.35),   # 225 to 135 degrees
+    "up": (5.49, 3.92),     # 315 to 225 degrees
+    "down": (2.35, 0.78),   # 135 to 45 degrees
+}
+
+_shapes = {}
+
+
+def _canvas(radius):
+    """Return a transparent surface with room for a shape of radius, and its center."""
+    size = 2 * radius + 2
+    return pygame.Surface((size, size), pygame.SRCALPHA), (radius + 1, radius + 1)
+
+
+def circle(radius, color):
+    key = ("circle", radius, color)
+    surface = _shapes.get(key)
+    if surface is None:
+        surface, center = _canvas(radius)
+        pygame.draw.circle(surface, color, center, radius)
+        _shapes[key] = surface
+    return surface
+
+
+def pacman(radius, direction, color, mouth_color):
+    """Pac-Man facing direction, with the mouth cut out in mouth_color."""
+    key = ("pacman", radius, direction, color, mouth_color)
+    surface = _shapes.get(key)
+    if surface is None:
+        surface, (cx, cy) = _canvas(radius)
+        pygame.draw.circle(surface, color, (cx, cy), radius)
+        start_angle, end_angle = MOUTH_ANGLES[direction]
+        start = pygame.math.Vector2(1, 0).rotate(start_angle * 57.3)
+        end = pygame.math.Vector2(1, 0).rotate(end_angle * 57.3)
+        pygame.draw.polygon(surface, mouth_color, [
+            (cx, cy),
+            (cx + radius * start.x, cy + radius * start.y),
+            (cx + radius * end.x, cy + radius * end.y)
+        ])
+        _shapes[key] = surface
+    return surface
+
+
+def draw_circle(screen, color, center, radius):
+    """Cached stand-in for pygame.draw.circle(screen, color, center, radius)."""
+    return screen.blit(circle(radius, color), (center[0] - radius - 1, center[1] - radius - 1))
+
+
+def draw_pacman(screen, center, radius, direction, color, mouth_color):
+    return screen.blit(pacman(radius, direction, color, mouth_color),
+                       (center[0] - radius - 1, center[1] - radius - 1))
@@ -1,6 +1,8 @@
 import pygame
 import time
 import random
+from collections import deque
+from text_cache import render_text
 
 # Initialize pygame
 pygame.init()
@@ -32,9 +34,88 @@ snake_speed = 15
 font_style = pygame.font.SysFont("bahnschrift", 25)
 score_font = pygame.font.SysFont("comicsansms", 35)
 
+class FreeCells:
+    """Every board cell the snake does not cover, for O(1) food placement.
+
+    The free cells are kept in a list with a dict mapping each cell to its
+    index. Taking a cell moves the last entry into its slot, so taking,
+    giving back and sampling a uniformly random free cell are all O(1) no
+    matter how full the board is.
+    """
+    def __init__(self, width, height, size):
+        self.width = width
+        self.height = height
+        self.cells = [(x, y) for y in range(0, height, size) for x in range(0, width, size)]
+        self.index = {cell: i for i, cell in enumerate(self.cells)}
+
+    def __len__(self):
+        return len(self.cells)
+
+    def take(self, cell):
+        i = self.index.pop(cell, None)
+        if i is None:
+            return  # Off the board
+        last = self.cells.pop()
+        if i < len(self.cells):
+            self.cells[i] = last
+            self.index[last] = i
+
+    def give(self, cell):
+        if 0 <= cell[0] < self.width and 0 <= cell[1] < self.height:
+            self.index[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def sample(self):
+        """Return a random free cell, or None if the snake fills the board."""
+        if not self.cells:
+            return None
+        return self.cells[random.randrange(len(self.cells))]
+
+class SnakeBody:
+    """The snake's cells, tail first, with a count of segments on each cell.
+
+    Adding a head and dropping the tail are deque operations and the counts
+    are kept in step, so a move and the self-hit test are O(1) however long
+    the snake gets. Cells the snake enters or leaves are taken from or given
+    back to free_cells, if given.
+    """
+    def __init__(self, free_cells=None):
+        self.cells = deque()
+        self.occupied = {}  # cell -> number of segments on it
+        self.free_cells = free_cells
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self):
+        return iter(self.cells)
+
+    def __contains__(self, cell):
+        return cell in self.occupied
+
+    def push_head(self, cell):
+        self.cells.append(cell)
+        count = self.occupied.get(cell, 0)
+        self.occupied[cell] = count + 1
+        if count == 0 and self.free_cells is not None:
+            self.free_cells.take(cell)
+
+    def pop_tail(self):
+        cell = self.cells.popleft()
+        if self.occupied[cell] == 1:
+            del self.occupied[cell]
+            if self.free_cells is not None:
+                self.free_cells.give(cell)
+        else:
+            self.occupied[cell] -= 1
+        return cell
+
+    def head_hits_body(self):
+        return self.occupied[self.cells[-1]] > 1
+
 # Function to display the score
 def display_score(score):
-    value = score_font.render("Your Score: " + str(score), True, yellow)
+    value = render_text(score_font, "Your Score: " + str(score), yellow)
     game_window.blit(value, [0, 0])
 
 # Function to draw the snake
@@ -44,7 +125,7 @@ def draw_snake(block_size, snake_list):
 
 # Function to display messages
 def display_message(msg, color):
-    mesg = font_style.render(msg, True, color)
+    mesg = render_text(font_style, msg, color)
     game_window.blit(mesg, [width / 6, height / 3])
 
 # Main game loop
@@ -60,13 +141,14 @@ def game_loop():
     x_change = 0
     y_change = 0
 
-    # Snake body
-    snake_list = []
+    # Snake body, and the cells it leaves free for food
+    free_cells = FreeCells(width, height, block_size)
+    snake = SnakeBody(free_cells)
+    snake.push_head((x, y))  # Claim the start cell before any food is placed
     snake_length = 1
 
     # Food position
-    food_x = round(random.randrange(0, width - block_size) / 10.0) * 10.0
-    food_y = round(random.randrange(0, height - block_size) / 10.0) * 10.0
+    food_x, food_y = free_cells.sample()
 
     while not game_over:
 
@@ -114,20 +196,18 @@ def game_loop():
         pygame.draw.rect(game_window, red, [food_x, food_y, block_size, block_size])
 
         # Add new head to the snake
-        snake_head = [x, y]
-        snake_list.append(snake_head)
+        snake.push_head((x, y))
 
         # Remove the tail if the snake is not growing
-        if len(snake_list) > snake_length:
-            del snake_list[0]
+        if len(snake) > snake_length:
+            snake.pop_tail()
 
         # Check if snake collides with itself
-        for block in snake_list[:-1]:
-            if block == snake_head:
-                game_close = True
+        if snake.head_hits_body():
+            game_close = True
 
         # Draw the snake
-        draw_snake(block_size, snake_list)
+        draw_snake(block_size, snake)
         display_score(snake_length - 1)
 
         # Update the display
@@ -135,8 +215,8 @@ def game_loop():
 
         # Check if snake eats the food
         if x == food_x and y == food_y:
-            food_x = round(random.randrange(0, width - block_size) / 10.0) * 10.0
-            food_y = round(random.randrange(0, height - block_size) / 10.0) * 10.0
+            # Park the food off screen once the snake fills the board
+            food_x, food_y = free_cells.sample() or (-block_size, -block_size)
             snake_length += 1
 
         # Control the speed of the game
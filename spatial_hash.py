@@ -0,0 +1,63 @@
+"""Uniform-grid spatial hash for batched broad-phase collision tests."""
+import numpy as np
+
+
+class SpatialHash:
+    """Points bucketed by the grid cell they fall in, rebuilt every frame.
+
+    build() sorts the points by cell key so each cell's points form one
+    contiguous run. pairs() expands a batch of boxes into the cells they
+    cover, finds those runs with one searchsorted call and tests only the
+    points in them. A point lies in exactly one cell, so every (box, point)
+    pair is reported once.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.build(np.empty(0), np.empty(0))
+
+    def key(self, cx, cy):
+        # Row numbers stay well inside +-32768 for any screen-sized world
+        return cx * 65536 + cy
+
+    def build(self, xs, ys):
+        self.xs = np.array(xs, dtype=float)
+        self.ys = np.array(ys, dtype=float)
+        keys = self.key(np.floor_divide(self.xs, self.cell_size).astype(np.int64),
+                        np.floor_divide(self.ys, self.cell_size).astype(np.int64))
+        self.order = np.argsort(keys, kind="stable")
+        self.keys = keys[self.order]
+
+    def pairs(self, xs, ys, widths, heights):
+        """Return (box_indices, point_indices) for points strictly inside boxes.
+
+        The boxes are given as arrays (or scalars for widths and heights).
+        Pairs come back sorted by box, then by point index.
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        widths = np.broadcast_to(np.asarray(widths, dtype=float), xs.shape)
+        heights = np.broadcast_to(np.asarray(heights, dtype=float), xs.shape)
+        cx0 = np.floor_divide(xs, self.cell_size).astype(np.int64)
+        cy0 = np.floor_divide(ys, self.cell_size).astype(np.int64)
+        cols = np.floor_divide(xs + widths, self.cell_size).astype(np.int64) - cx0 + 1
+        rows = np.floor_divide(ys + heights, self.cell_size).astype(np.int64) - cy0 + 1
+
+        # One entry per (box, covered cell)
+        cells = cols * rows
+        box = np.repeat(np.arange(len(xs)), cells)
+        local = np.arange(cells.sum()) - np.repeat(np.cumsum(cells) - cells, cells)
+        keys = self.key(cx0[box] + local % cols[box], cy0[box] + local // cols[box])
+
+        # One entry per (box, point in a covered cell)
+        lo = np.searchsorted(self.keys, keys, "left")
+        found = np.searchsorted(self.keys, keys, "right") - lo
+        box = np.repeat(box, found)
+        run = np.arange(found.sum()) - np.repeat(np.cumsum(found) - found, found)
+        point = self.order[np.repeat(lo, found) + run]
+
+        px, py = self.xs[point], self.ys[point]
+        hit = ((xs[box] < px) & (px < xs[box] + widths[box]) &
+               (ys[box] < py) & (py < ys[box] + heights[box]))
+        box, point = box[hit], point[hit]
+        order = np.lexsort((point, box))
+        return box[order], point[order]
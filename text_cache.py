@@ -0,0 +1,35 @@
+"""Font and rendered-text caching for the game HUDs."""
+from collections import OrderedDict
+
+import pygame
+
+MAX_SURFACES = 256  # Rendered texts kept before the least recently used is dropped
+
+_fonts = {}
+_surfaces = OrderedDict()
+
+
+def get_font(name=None, size=36, sysfont=False):
+    """Return a Font (or SysFont), creating it only on the first request."""
+    key = (name, size, sysfont)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.SysFont(name, size) if sysfont else pygame.font.Font(name, size)
+    return font
+
+
+def render_text(font, text, color, antialias=True):
+    """Return font.render(text, antialias, color), reusing earlier renders.
+
+    Surfaces are memoized by (font, text, color, antialias), so a HUD line
+    is only rasterized again when its text changes.
+    """
+    key = (font, text, color, antialias)
+    surface = _surfaces.get(key)
+    if surface is None:
+        surface = _surfaces[key] = font.render(text, antialias, color)
+        if len(_surfaces) > MAX_SURFACES:
+            _surfaces.popitem(last=False)
+    else:
+        _surfaces.move_to_end(key)
+    return surface
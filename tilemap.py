@@ -0,0 +1,167 @@
+"""Tile-based levels for the platformer: text format, grid collision, streamed drawing."""
+import pygame
+
+EMPTY = "."
+SOLID = "#"
+PLATFORM = "="  # One-way: only blocks from above
+
+
+class TileMap:
+    """A level stored as rows of tile characters, one character per tile.
+
+    Level text has one line per row of tiles: '#' is a solid block, '=' a
+    one-way platform that can only be landed on from above, and anything
+    else is empty. Short lines are padded with empty tiles. The tiles form
+    a uniform grid, so the tiles under any box are found by dividing its
+    edges by the tile size and collision cost does not grow with the level.
+    """
+    def __init__(self, rows, tile_size=20):
+        self.tile_size = tile_size
+        self.cols = max((len(row) for row in rows), default=0)
+        self.rows = [row.ljust(self.cols, EMPTY) for row in rows]
+        self.width = self.cols * tile_size
+        self.height = len(self.rows) * tile_size
+
+    @classmethod
+    def parse(cls, text, tile_size=20):
+        return cls(text.strip("\n").splitlines(), tile_size)
+
+    @classmethod
+    def load(cls, path, tile_size=20):
+        with open(path) as f:
+            return cls.parse(f.read(), tile_size)
+
+    def tile(self, col, row):
+        """The tile at (col, row); everything outside the level is empty."""
+        if 0 <= row < len(self.rows) and 0 <= col < self.cols:
+            return self.rows[row][col]
+        return EMPTY
+
+    def span(self, low, high):
+        """Grid indices of the cells overlapping the pixel range [low, high)."""
+        return range(int(low // self.tile_size), -int(-high // self.tile_size))
+
+    def tiles_in(self, rect):
+        """Yield (Rect, tile) for every non-empty tile overlapping rect."""
+        size = self.tile_size
+        cols = self.span(max(rect.left, 0), min(rect.right, self.width))
+        for row in self.span(max(rect.top, 0), min(rect.bottom, self.height)):
+            line = self.rows[row]
+            for col in cols:
+                if line[col] != EMPTY:
+                    yield pygame.Rect(col * size, row * size, size, size), line[col]
+
+    def blocked(self, cols, rows, tiles):
+        return any(self.tile(col, row) in tiles for col in cols for row in rows)
+
+    def move_x(self, x, y, width, height, dx):
+        """Move a box horizontally by dx, stopping at the first solid tile.
+
+        Only the columns the box's leading edge sweeps through are checked,
+        nearest first, so fast movement cannot tunnel through a wall.
+        Returns the new x and whether the box was stopped.
+        """
+        size = self.tile_size
+        rows = self.span(y, y + height)
+        if dx > 0:
+            for col in range(-int(-(x + width) // size), -int(-(x + width + dx) // size)):
+                if self.blocked((col,), rows, SOLID):
+                    return col * size - width, True
+        elif dx < 0:
+            for col in range(int(x // size) - 1, int((x + dx) // size) - 1, -1):
+                if self.blocked((col,), rows, SOLID):
+                    return (col + 1) * size, True
+        return x + dx, False
+
+    def move_y(self, x, y, width, height, dy):
+        """Move a box vertically by dy, like move_x.
+
+        Falling stops on solid tiles and one-way platforms; rising only on
+        solid tiles. Returns the new y and whether the box was stopped.
+        """
+        size = self.tile_size
+        cols = self.span(x, x + width)
+        if dy > 0:
+            for row in range(-int(-(y + height) // size), -int(-(y + height + dy) // size)):
+                if self.blocked(cols, (row,), SOLID + PLATFORM):
+                    return row * size - height, True
+        elif dy < 0:
+            for row in range(int(y // size) - 1, int((y + dy) // size) - 1, -1):
+                if self.blocked(cols, (row,), SOLID):
+                    return (row + 1) * size, True
+        return y + dy, False
+
+
+class Camera:
+    """The view's top-left corner in the level, kept centered on a target.
+
+    The view is clamped to the level, so it stops scrolling at the edges.
+    """
+    def __init__(self, view_size, level_size):
+        self.width, self.height = view_size
+        self.max_x = max(0, level_size[0] - self.width)
+        self.max_y = max(0, level_size[1] - self.height)
+        self.x = 0
+        self.y = 0
+
+    def follow(self, x, y, width, height):
+        self.x = int(min(max(x + width / 2 - self.width / 2, 0), self.max_x))
+        self.y = int(min(max(y + height / 2 - self.height / 2, 0), self.max_y))
+
+    def apply(self, rect):
+        """rect moved from level to screen coordinates."""
+        return rect.move(-self.x, -self.y)
+
+
+class ChunkStreamer:
+    """Pre-rendered slices of a level, kept only around the camera.
+
+    The level is cut into chunks chunk_cols tiles wide. A chunk is drawn
+    once onto its own surface when it comes within margin chunks of the
+    view, and evicted once it leaves that window. Evicted surfaces are
+    reused for the next chunk to load. The number of surfaces and the
+    blits per frame depend on the view width, never on the level length.
+    """
+    def __init__(self, level, tile_colors, view_width, chunk_cols=16, margin=1, background=(255, 255, 255)):
+        self.level = level
+        self.tile_colors = tile_colors
+        self.view_width = view_width
+        self.chunk_width = chunk_cols * level.tile_size
+        self.margin = margin
+        self.background = background
+        self.count = -(-level.width // self.chunk_width)
+        self.chunks = {}  # chunk index -> Surface
+        self.spare = []  # Evicted surfaces waiting to be reused
+
+    def window(self, camera_x, margin=0):
+        """Indices of the chunks in view, widened by margin chunks each side."""
+        first = camera_x // self.chunk_width - margin
+        last = (camera_x + self.view_width - 1) // self.chunk_width + margin
+        return range(max(first, 0), min(last + 1, self.count))
+
+    def update(self, camera_x):
+        """Load the chunks around the view and evict the rest."""
+        wanted = self.window(camera_x, self.margin)
+        for index in [index for index in self.chunks if index not in wanted]:
+            self.spare.append(self.chunks.pop(index))
+        for index in wanted:
+            if index not in self.chunks:
+                self.chunks[index] = self.render(index)
+
+    def render(self, index):
+        if self.spare:
+            surface = self.spare.pop()
+        else:
+            surface = pygame.Surface((self.chunk_width, self.level.height))
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+        surface.fill(self.background)
+        left = index * self.chunk_width
+        for rect, tile in self.level.tiles_in(pygame.Rect(left, 0, self.chunk_width, self.level.height)):
+            surface.fill(self.tile_colors.get(tile, (0, 0, 0)), rect.move(-left, 0))
+        return surface
+
+    def draw(self, screen, camera):
+        """Blit the chunks in view; update() must have been called for camera.x."""
+        for index in self.window(camera.x):
+            screen.blit(self.chunks[index], (index * self.chunk_width - camera.x, -camera.y))